@@ -3,12 +3,39 @@ GlucoMate Core - Level 1: Base Bedrock Foundation
 Provides consistent Bedrock integration and core functionality for all GlucoMate variants
 """
 
-import boto3
-import json
 import sys
 import os
+from functools import cached_property
 from medical_safety import MedicalSafetyGuardrails
 
+try:
+    # Line editing and history for the chat prompts (not available on Windows)
+    import readline  # noqa: F401
+except ImportError:
+    readline = None
+
+def _load_env_file():
+    """
+    Load KEY=VALUE pairs from a .env file into the environment
+    
+    Looks in the working directory, then next to this module. Variables that
+    are already set win, as with python-dotenv.
+    """
+    for folder in (os.getcwd(), os.path.dirname(os.path.abspath(__file__))):
+        path = os.path.join(folder, ".env")
+        if not os.path.isfile(path):
+            continue
+        
+        with open(path, encoding="utf-8") as env_file:
+            for line in env_file:
+                line = line.strip()
+                if line.startswith("export "):
+                    line = line[len("export "):]
+                key, sep, value = line.partition("=")
+                if sep and key and not key.startswith("#"):
+                    os.environ.setdefault(key.strip(), value.strip().strip("'\""))
+        return
+
 class GlucoMateCore:
     """
     Base class for all GlucoMate variants.
@@ -16,13 +43,43 @@ class GlucoMateCore:
     """
     
     def __init__(self):
-        # Standardized AWS clients
-        self.bedrock_client = boto3.client('bedrock-runtime', region_name='us-east-1')
-        self.bedrock_agent = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
-        self.translate_client = boto3.client('translate', region_name='us-east-1')
+        # AWS credentials and search keys may come from .env, so load it before any client exists
+        _load_env_file()
+        
+        # Consistent model configuration across ALL GlucoMate variants.
+        # All generation (chat, search synthesis, knowledge base answers) uses a
+        # model with latency-optimized inference, which is only offered in us-east-2
+        self.chat_model_id = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
+        self.chat_region = "us-east-2"
+        self.latency_mode = "optimized"
+        
+        # Optional live output: called with each piece of generated text as it arrives
+        self.stream_callback = None
+        self._streamed_text = ""
+        
+        # Standardized AWS clients share one session and connection settings:
+        # kept-alive pooled connections, and adaptive retries for Bedrock throttling.
+        # boto3 is imported here so importing GlucoMate modules stays fast
+        import boto3
+        from botocore.config import Config
+        
+        self.aws_session = boto3.Session()
+        self.aws_config = Config(
+            tcp_keepalive=True,
+            max_pool_connections=32,
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            connect_timeout=2,
+            read_timeout=30
+        )
+        # Client attribute -> (service, region), used to rebuild a client with stale connections
+        self._client_specs = {
+            'bedrock_client': ('bedrock-runtime', self.chat_region),
+            'bedrock_agent': ('bedrock-agent-runtime', 'us-east-1'),
+            'translate_client': ('translate', 'us-east-1')
+        }
+        self.bedrock_client = self._create_client('bedrock_client')
+        # bedrock_agent and translate_client are created on first use (see below)
         
-        # Consistent model configuration across ALL GlucoMate variants
-        self.model_id = "amazon.titan-text-premier-v1:0"
         self.default_temperature = 0.3  # Medical accuracy focused
         self.max_tokens = 2048
         self.top_p = 0.9
@@ -30,6 +87,31 @@ class GlucoMateCore:
         # Safety guardrails (consistent across all implementations)
         self.safety = MedicalSafetyGuardrails()
         
+        # Conversation type indicators
+        self.urgent_keywords = [
+            'emergency', 'urgent', 'help', '911', 'hospital', 'dying', 'emergency room',
+            'ambulance', 'call doctor', 'severe', 'can\'t breathe', 'chest pain',
+            'unconscious', 'passed out', 'blood sugar 400', 'dka', 'ketoacidosis'
+        ]
+        self.casual_keywords = [
+            'hi', 'hello', 'hey', 'how are you', 'what\'s up', 'thanks', 'thank you',
+            'good morning', 'good afternoon', 'good evening', 'bye', 'goodbye',
+            'comment ça va', 'ça va', 'كيف حالك', '¿cómo estás', 'hola', 'bonjour',
+            'guten tag', 'bom dia', 'marhaba'
+        ]
+        
+        # Requests that deserve a long answer
+        self.detailed_request_keywords = [
+            'explain', 'overview', 'detailed', 'in detail', 'everything about',
+            'step by step', 'compare', 'difference between'
+        ]
+        
+        # Share the safety scanner so each turn is tagged in a single pass
+        self.keyword_scanner = self.safety.scanner
+        self.keyword_scanner.add('urgent', self.urgent_keywords)
+        self.keyword_scanner.add('casual', self.casual_keywords)
+        self.keyword_scanner.add('detailed', self.detailed_request_keywords)
+        
         # Standardized language support
         self.supported_languages = {
             '1': ('English', 'en'),
@@ -39,6 +121,7 @@ class GlucoMateCore:
             '5': ('Portuguese', 'pt'),
             '6': ('German', 'de')
         }
+        self._lang_code_to_name = {code: name for name, code in self.supported_languages.values()}
         
         # Consistent encouragement phrases
         self.encouragement = [
@@ -57,20 +140,56 @@ class GlucoMateCore:
             "I'm here to help you understand",
             "Let me share what I know about"
         ]
+        
+        # Prompt skeletons per supported language, only the user slots vary per turn
+        self._prompt_templates = {
+            name: self._build_prompt_templates(name)
+            for name, _ in self.supported_languages.values()
+        }
+    
+    @cached_property
+    def bedrock_agent(self):
+        """Bedrock Agent Runtime client, created on the first knowledge base lookup"""
+        return self._create_client('bedrock_agent')
+    
+    @cached_property
+    def translate_client(self):
+        """AWS Translate client, created on the first non-English request"""
+        return self._create_client('translate_client')
+    
+    def _create_client(self, client_name):
+        """Create one of the standardized AWS clients from the shared session and config"""
+        service, region = self._client_specs[client_name]
+        return self.aws_session.client(service, region_name=region, config=self.aws_config)
     
-    def call_bedrock_model(self, prompt, temperature=None, max_tokens=None, conversation_type="medical"):
+    def call_aws(self, client_name, operation, **params):
         """
-        Standardized Bedrock model calling with consistent error handling
+        Call an AWS client operation, reconnecting once if the connection went stale
         
-        Args:
-            prompt (str): The prompt to send to Bedrock
-            temperature (float): Override default temperature
-            max_tokens (int): Override default max tokens  
-            conversation_type (str): 'medical', 'casual', 'emergency'
+        Pooled keep-alive connections can be closed by the server while idle.
+        When that surfaces as a dropped connection or read timeout, the client is
+        rebuilt with fresh connections and the call is retried a single time.
         
+        Args:
+            client_name (str): 'bedrock_client', 'bedrock_agent' or 'translate_client'
+            operation (str): Client method name, e.g. 'converse'
+            **params: Parameters for the operation
+            
         Returns:
-            str: The response from Bedrock or an error message
+            dict: The operation's response
         """
+        from botocore.exceptions import ConnectionClosedError, ReadTimeoutError
+        from urllib3.exceptions import ProtocolError
+        
+        try:
+            return getattr(getattr(self, client_name), operation)(**params)
+        except (ConnectionClosedError, ReadTimeoutError, ProtocolError) as e:
+            print(f"🔄 Reconnecting to AWS after a dropped connection: {str(e)[:60]}")
+            setattr(self, client_name, self._create_client(client_name))
+            return getattr(getattr(self, client_name), operation)(**params)
+    
+    def _build_converse_request(self, prompt, temperature, max_tokens, conversation_type, system):
+        """Converse request shared by the blocking and streaming Bedrock calls"""
         # Adjust temperature based on conversation type for optimal responses
         if temperature is None:
             if conversation_type == "medical":
@@ -84,30 +203,109 @@ class GlucoMateCore:
         
         if max_tokens is None:
             max_tokens = self.max_tokens
-            
+        
+        request = {
+            "modelId": self.chat_model_id,
+            "messages": [{"role": "user", "content": [{"text": prompt}]}],
+            "inferenceConfig": {
+                "maxTokens": max_tokens,
+                "temperature": temperature,
+                "topP": self.top_p
+            },
+            # Must be top level, not in additionalModelRequestFields
+            "performanceConfig": {"latency": self.latency_mode}
+        }
+        if system:
+            request["system"] = [{"text": system}]
+        
+        return request
+    
+    def stream_bedrock_model(self, prompt, temperature=None, max_tokens=None, conversation_type="medical", system=None):
+        """
+        Stream a Bedrock response, yielding text as soon as it is generated
+        
+        Takes the same arguments as call_bedrock_model. Errors are raised to the
+        caller, since part of the answer may already have been consumed.
+        
+        Yields:
+            str: Consecutive pieces of the response text
+        """
+        request = self._build_converse_request(prompt, temperature, max_tokens, conversation_type, system)
+        response = self.call_aws('bedrock_client', 'converse_stream', **request)
+        
+        # botocore decodes each event already; only text deltas matter here
+        for event in response['stream']:
+            delta = event.get('contentBlockDelta')
+            if delta:
+                text = delta['delta'].get('text')
+                if text:
+                    yield text
+    
+    def call_bedrock_model(self, prompt, temperature=None, max_tokens=None, conversation_type="medical", raise_errors=False, system=None, on_text=None):
+        """
+        Standardized Bedrock model calling with consistent error handling
+        
+        Args:
+            prompt (str): The prompt to send to Bedrock
+            temperature (float): Override default temperature
+            max_tokens (int): Override default max tokens  
+            conversation_type (str): 'medical', 'casual', 'emergency'
+            raise_errors (bool): Raise Bedrock errors instead of returning a friendly message
+            system (str): Static instructions sent as the system prompt, kept
+                apart from the per-turn prompt
+            on_text (callable): Stream the response, passing each text chunk to
+                this callback as soon as Bedrock generates it
+        
+        Returns:
+            str: The response from Bedrock or an error message
+        """
         try:
-            body = {
-                "inputText": prompt,
-                "textGenerationConfig": {
-                    "maxTokenCount": max_tokens,
-                    "temperature": temperature,
-                    "topP": self.top_p,
-                    "stopSequences": []
-                }
-            }
+            if on_text:
+                chunks = []
+                for text in self.stream_bedrock_model(prompt, temperature, max_tokens, conversation_type, system):
+                    chunks.append(text)
+                    on_text(text)
+                return ''.join(chunks)
             
-            response = self.bedrock_client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(body),
-                contentType='application/json'
-            )
+            request = self._build_converse_request(prompt, temperature, max_tokens, conversation_type, system)
+            response = self.call_aws('bedrock_client', 'converse', **request)
             
-            response_body = json.loads(response['body'].read())
-            return response_body['results'][0]['outputText']
+            return response['output']['message']['content'][0]['text']
             
         except Exception as e:
+            if raise_errors:
+                raise
             return self._handle_bedrock_error(e)
     
+    def stream_to_terminal(self, label):
+        """
+        Print generated text to the terminal while Bedrock is still writing it
+        
+        Only answers whose text is shown as-is get streamed (English, no safety
+        warning in front); print_response then prints whatever is left.
+        
+        Args:
+            label (str): Speaker label printed before the first chunk
+        """
+        def print_chunk(text):
+            if not self._streamed_text:
+                print(f"\n{label}", end="", flush=True)
+            self._streamed_text += text
+            print(text, end="", flush=True)
+        
+        self.stream_callback = print_chunk
+    
+    def print_response(self, response, label):
+        """Print a chat response, skipping the part that was already streamed"""
+        streamed, self._streamed_text = self._streamed_text, ""
+        
+        if streamed and response.startswith(streamed):
+            print(response[len(streamed):])
+        else:
+            if streamed:
+                print()
+            print(f"\n{label}{response}")
+    
     def _handle_bedrock_error(self, error):
         """Standardized error handling for Bedrock calls"""
         error_str = str(error)
@@ -125,9 +323,39 @@ class GlucoMateCore:
         else:
             return f"I'm experiencing technical difficulties right now. Please try again in a moment. If the problem persists, the technical details are: {error_str[:100]}"
     
-    def check_safety(self, user_input):
+    def scan_keywords(self, user_input):
+        """Tag user input with every keyword category in one pass"""
+        return self.keyword_scanner.scan(user_input)
+    
+    def estimate_max_tokens(self, user_input, conversation_type="medical", matches=None):
+        """
+        Pick an output token budget that fits the question
+        
+        Decode time grows with every generated token, so short questions
+        shouldn't reserve room for a full overview.
+        
+        Args:
+            user_input (str): User's question in English
+            conversation_type (str): 'medical', 'casual', 'emergency'
+            matches (dict): Result of scan_keywords(user_input), if already computed
+            
+        Returns:
+            int: maxTokenCount to request
+        """
+        if conversation_type in ("casual", "emergency"):
+            return 400
+        
+        if matches is None:
+            matches = self.scan_keywords(user_input)
+        
+        if 'detailed' in matches or len(user_input.split()) > 25:
+            return 1500
+        
+        return 800
+    
+    def check_safety(self, user_input, matches=None):
         """Standardized safety checking across all implementations"""
-        return self.safety.check_emergency_situation(user_input)
+        return self.safety.check_emergency_situation(user_input, matches)
     
     def create_base_diabetes_prompt(self, user_input, additional_context="", language="English", conversation_type="medical"):
         """
@@ -143,31 +371,50 @@ class GlucoMateCore:
             str: Complete prompt ready for Bedrock
         """
         
-        if conversation_type == "casual":
-            base_prompt = f"""You are GlucoMate, a friendly and caring diabetes companion. Someone said: "{user_input}"
+        templates = self._prompt_templates.get(language)
+        if templates is None:
+            templates = self._build_prompt_templates(language)
+        
+        # Emergency and casual prompts use their own tone; everything else is medical
+        template = templates.get(conversation_type, templates["medical"])
+        return template.format(user_input=user_input, additional_context=additional_context)
+    
+    def _build_prompt_templates(self, language):
+        """
+        Build the prompt skeletons for one language
+        
+        Only {user_input} and {additional_context} are left as slots, so each
+        turn formats a ready-made string instead of rebuilding the whole prompt.
+        
+        Args:
+            language (str): Target language name
+            
+        Returns:
+            dict: conversation_type -> prompt template
+        """
+        return {
+            "casual": f"""You are GlucoMate, a friendly and caring diabetes companion. Someone said: "{{user_input}}"
 
 This seems like casual conversation. Respond naturally and warmly, like a knowledgeable friend would. Keep it brief but caring. You can mention that you're here to help with diabetes questions if appropriate, but don't make it sound scripted.
 
-{additional_context}
+{{additional_context}}
 
-Respond in {language} in a natural, conversational way:"""
-        
-        elif conversation_type == "emergency":
-            base_prompt = f"""You are GlucoMate, a medical AI assistant. This appears to be a medical emergency situation: "{user_input}"
+Respond in {language} in a natural, conversational way:""",
+            
+            "emergency": f"""You are GlucoMate, a medical AI assistant. This appears to be a medical emergency situation: "{{user_input}}"
 
 Provide immediate, clear guidance prioritizing the person's safety. Be direct and authoritative. Guide them to emergency services if needed.
 
-{additional_context}
+{{additional_context}}
 
-Respond in {language} with clear, emergency-appropriate guidance:"""
-        
-        else:  # medical or other types
-            base_prompt = f"""You are GlucoMate, an AI assistant specialized in diabetes care and education. You provide accurate, evidence-based information about diabetes management with warmth and empathy.
+Respond in {language} with clear, emergency-appropriate guidance:""",
+            
+            "medical": f"""You are GlucoMate, an AI assistant specialized in diabetes care and education. You provide accurate, evidence-based information about diabetes management with warmth and empathy.
 
-User Input: {user_input}
+User Input: {{user_input}}
 Response Language: {language}
 
-{additional_context}
+{{additional_context}}
 
 Guidelines for your response:
 1. Provide accurate, evidence-based diabetes information
@@ -182,39 +429,32 @@ Guidelines for your response:
 10. Sound like a knowledgeable, caring friend rather than a medical textbook
 
 Respond in {language}:"""
-        
-        return base_prompt
+        }
     
     def add_medical_disclaimer(self, response, language="English"):
         """Standardized medical disclaimer in multiple languages"""
         return self.safety.add_medical_disclaimer(response, language)
     
-    def classify_conversation_type(self, user_input):
+    def classify_conversation_type(self, user_input, matches=None):
         """
         Classify conversation type for appropriate response handling
         
+        Args:
+            user_input (str): User's input
+            matches (dict): Result of scan_keywords(user_input), if already computed
+        
         Returns:
             str: 'emergency', 'casual', 'medical'
         """
-        user_input_lower = user_input.lower()
+        if matches is None:
+            matches = self.scan_keywords(user_input)
         
         # Emergency indicators
-        emergency_keywords = [
-            'emergency', 'urgent', 'help', '911', 'hospital', 'dying', 'emergency room',
-            'ambulance', 'call doctor', 'severe', 'can\'t breathe', 'chest pain',
-            'unconscious', 'passed out', 'blood sugar 400', 'dka', 'ketoacidosis'
-        ]
-        if any(keyword in user_input_lower for keyword in emergency_keywords):
+        if 'urgent' in matches:
             return "emergency"
         
-        # Casual conversation indicators  
-        casual_keywords = [
-            'hi', 'hello', 'hey', 'how are you', 'what\'s up', 'thanks', 'thank you',
-            'good morning', 'good afternoon', 'good evening', 'bye', 'goodbye',
-            'comment ça va', 'ça va', 'كيف حالك', '¿cómo estás', 'hola', 'bonjour',
-            'guten tag', 'bom dia', 'marhaba'
-        ]
-        if any(keyword in user_input_lower for keyword in casual_keywords):
+        # Casual conversation indicators
+        if 'casual' in matches:
             return "casual"
         
         # Medical conversation (default)
@@ -232,13 +472,14 @@ Respond in {language}:"""
             str: Complete response with safety checks and disclaimers
         """
         # Safety check first - this is critical
-        safety_check = self.check_safety(user_input)
+        keyword_matches = self.scan_keywords(user_input)
+        safety_check = self.check_safety(user_input, keyword_matches)
         
         if safety_check['is_emergency']:
             return safety_check['message']
         
         # Classify conversation type
-        conversation_type = self.classify_conversation_type(user_input)
+        conversation_type = self.classify_conversation_type(user_input, keyword_matches)
         
         # Create appropriate prompt
         prompt = self.create_base_diabetes_prompt(
@@ -247,8 +488,13 @@ Respond in {language}:"""
             conversation_type=conversation_type
         )
         
-        # Get response from Bedrock
-        response = self.call_bedrock_model(prompt, conversation_type=conversation_type)
+        # Get response from Bedrock, streamed when nothing will be shown before it
+        response = self.call_bedrock_model(
+            prompt,
+            conversation_type=conversation_type,
+            max_tokens=self.estimate_max_tokens(user_input, conversation_type, keyword_matches),
+            on_text=self.stream_callback if safety_check['urgency_level'] == 'NORMAL' else None
+        )
         
         # Add disclaimer for medical conversations
         if conversation_type == "medical":
@@ -347,6 +593,7 @@ def main():
     print("   • Warm, supportive conversation style")
     
     bot = GlucoMateBot()
+    bot.stream_to_terminal("🩺 GlucoMate: ")
     
     print(f"\n💬 Ask me anything about diabetes management!")
     print("🌟 Try: 'What is diabetes?' or 'How do I check my blood sugar?'")
@@ -363,7 +610,7 @@ def main():
             if user_input:
                 print("\n💭 Thinking...")
                 response = bot.chat(user_input)
-                print(f"\n🩺 GlucoMate: {response}")
+                bot.print_response(response, "🩺 GlucoMate: ")
                 print("\n" + "─" * 60)
             else:
                 print("💭 I'm here whenever you're ready to chat!")
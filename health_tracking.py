@@ -4,7 +4,6 @@ Inherits: Bedrock core, safety, multilingual, knowledge base, smart search, pers
 Adds: Weekly check-ins, progress tracking, milestone achievements, trend analysis
 """
 
-import boto3
 import json
 import sys
 import os
@@ -859,7 +858,7 @@ def main():
     
     exit_instruction = "Type 'quit' to exit"
     if language_code != 'en':
-        exit_instruction = bot.translate_response(exit_instruction, language_code)
+        exit_instruction = bot.translate_static(exit_instruction, language_code)
     print(f"\n{exit_instruction}")
     
     try:
@@ -870,11 +869,10 @@ def main():
                 if bot.patient_profile:
                     name = bot.patient_profile.get('name', 'there')
                     farewell = f"Take care, {name}! Keep up the excellent work with your diabetes management. I'm so proud of your progress! 🌟"
+                    farewell = bot.translate_response(farewell, language_code)
                 else:
+                    # Already written in the user's language
                     farewell = bot.get_cultural_farewell(language_code)
-                
-                if language_code != 'en':
-                    farewell = bot.translate_response(farewell, language_code)
                 print(f"\n💙 GlucoMate: {farewell}")
                 
                 # Show final stats
@@ -890,7 +888,7 @@ def main():
             else:
                 ready_msg = "I'm here with comprehensive diabetes care and progress tracking!"
                 if language_code != 'en':
-                    ready_msg = bot.translate_response(ready_msg, language_code)
+                    ready_msg = bot.translate_static(ready_msg, language_code)
                 print(f"💭 {ready_msg}")
                 
     except KeyboardInterrupt:
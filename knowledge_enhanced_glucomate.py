@@ -4,10 +4,23 @@ Inherits: Bedrock core, safety, multilingual support
 Adds: Knowledge base queries, medical citations, authoritative sources
 """
 
-import boto3
 import json
 import sys
+from medical_safety import KeywordScanner
 from multilingual_glucomate import MultilingualGlucoMate
+from response_cache import TTLCache, query_cache_key
+
+# Static instructions for answering from knowledge base passages; the answer
+# comes back already in GlucoMate's warm voice, so no second rewrite call is needed
+_KB_SYSTEM_PROMPT = (
+    "You are GlucoMate, a warm and caring diabetes companion. Answer the question "
+    "after <<QUESTION>> from the knowledge base passages after <<PASSAGES>> like a "
+    "knowledgeable friend: keep every medical detail, show empathy, explain simply, "
+    "and add practical tips. If the passages don't answer the question, say so."
+)
+
+# Passages retrieved per question
+_KB_RESULTS = 5
 
 class KnowledgeEnhancedGlucoMate(MultilingualGlucoMate):
     """
@@ -22,6 +35,9 @@ class KnowledgeEnhancedGlucoMate(MultilingualGlucoMate):
         # Knowledge base configuration
         self.knowledge_base_id = "GXJOYBIHCU"  # Your actual Knowledge Base ID
         
+        # Recent knowledge base answers, keyed by normalized question
+        self._kb_cache = TTLCache(maxsize=1024, ttl=3600)
+        
         # Query enhancement for better knowledge base results
         self.medical_query_enhancements = {
             'blood sugar': 'blood glucose levels diabetes management',
@@ -33,6 +49,10 @@ class KnowledgeEnhancedGlucoMate(MultilingualGlucoMate):
             'medication': 'diabetes medications metformin insulin therapy',
             'monitoring': 'blood glucose monitoring testing devices'
         }
+        self._query_topic_scanner = KeywordScanner({
+            'diabetes': ['diabetes'],
+            'topic': list(self.medical_query_enhancements)
+        })
         
         print("📚 GlucoMate Level 3: Knowledge base integration loaded")
     
@@ -46,15 +66,16 @@ class KnowledgeEnhancedGlucoMate(MultilingualGlucoMate):
         Returns:
             str: Enhanced query for knowledge base
         """
-        question_lower = question.lower()
+        matches = self._query_topic_scanner.scan(question)
         
         # Add diabetes context if not present
-        if 'diabetes' not in question_lower:
+        if 'diabetes' not in matches:
             question = f"diabetes {question}"
         
-        # Enhance with medical terminology
+        # Enhance with medical terminology (first topic in table order)
+        topics = matches.get('topic', [])
         for key_term, enhancement in self.medical_query_enhancements.items():
-            if key_term in question_lower:
+            if key_term in topics:
                 # Don't replace, just add context
                 question = f"{question} {enhancement}"
                 break
@@ -62,39 +83,61 @@ class KnowledgeEnhancedGlucoMate(MultilingualGlucoMate):
         print(f"🔍 Enhanced query: {question}")
         return question
     
-    def query_medical_knowledge(self, question):
+    def query_medical_knowledge(self, question, busy_message=True, on_text=None):
         """
         Query the diabetes knowledge base for authoritative information
         
         Args:
             question (str): User's question
+            busy_message (bool): When throttled, return a friendly "try again" message
+                instead of None
+            on_text (callable): Stream the answer, passing each text chunk to this
+                callback as soon as Bedrock generates it
             
         Returns:
             str: Knowledge base response with citations or None if failed
         """
+        cache_key = query_cache_key(question)
+        cached_answer = self._kb_cache.get(cache_key)
+        if cached_answer:
+            print("⚡ Knowledge base answer from cache")
+            return cached_answer
+        
         try:
-            # Enhance query for better results
-            enhanced_query = self.enhance_query_for_knowledge_base(question)
-            
-            response = self.bedrock_agent.retrieve_and_generate(
-                input={'text': enhanced_query},
-                retrieveAndGenerateConfiguration={
-                    'type': 'KNOWLEDGE_BASE',
-                    'knowledgeBaseConfiguration': {
-                        'knowledgeBaseId': self.knowledge_base_id,
-                        'modelArn': f'arn:aws:bedrock:us-east-1::foundation-model/{self.model_id}'
-                    }
-                }
-            )
+            passages = self.retrieve_medical_passages(question)
+            if not passages:
+                print("📚 No relevant knowledge base passages found")
+                return None
             
-            # Extract response and sources
-            answer = response['output']['text']
-            citations = response.get('citations', [])
+            # Generate the answer from the passages (inherited methods)
+            passage_text = "\n\n".join(passages)
+            prompt = f"<<QUESTION>>\n{question}\n<<PASSAGES>>\n{passage_text}"
+            starter = None
+            if on_text:
+                answer, starter = self._stream_with_warm_starter(
+                    self.stream_bedrock_model(
+                        prompt,
+                        conversation_type="medical",
+                        max_tokens=self.estimate_max_tokens(question),
+                        system=_KB_SYSTEM_PROMPT
+                    ),
+                    on_text
+                )
+            else:
+                answer = self.call_bedrock_model(
+                    prompt,
+                    conversation_type="medical",
+                    max_tokens=self.estimate_max_tokens(question),
+                    raise_errors=True,  # Errors are handled below, not cached
+                    system=_KB_SYSTEM_PROMPT  # Static instructions, separate from the per-turn passages
+                )
             
             # Process and enhance the response
-            enhanced_answer = self.process_knowledge_response(answer, citations)
+            enhanced_answer = self.process_knowledge_response(answer, passages, starter)
+            self._kb_cache.set(cache_key, enhanced_answer)
             
-            print("✅ Response from medical knowledge base")
+            if not on_text:  # Status lines would land inside the streamed answer
+                print("✅ Response from medical knowledge base")
             return enhanced_answer
             
         except Exception as e:
@@ -103,6 +146,8 @@ class KnowledgeEnhancedGlucoMate(MultilingualGlucoMate):
             
             # Provide specific error handling
             if "ThrottlingException" in error_msg:
+                if not busy_message:
+                    return None
                 return "I'm getting a lot of requests right now. Let me try to help with what I know, or please try again in a moment."
             elif "ValidationException" in error_msg:
                 return None  # Let it fall back to regular response
@@ -112,30 +157,104 @@ class KnowledgeEnhancedGlucoMate(MultilingualGlucoMate):
             else:
                 return None
     
-    def process_knowledge_response(self, answer, citations):
+    def retrieve_medical_passages(self, question):
+        """
+        Retrieve knowledge base passages for a question
+        
+        Repeated questions are answered from the answer cache in
+        query_medical_knowledge, so passages themselves aren't cached.
+        
+        Args:
+            question (str): User's question in English
+            
+        Returns:
+            list: Passage texts, most relevant first
+        """
+        # Enhance query for better results
+        enhanced_query = self.enhance_query_for_knowledge_base(question)
+        
+        response = self.call_aws(
+            'bedrock_agent', 'retrieve',
+            knowledgeBaseId=self.knowledge_base_id,
+            retrievalQuery={'text': enhanced_query},
+            retrievalConfiguration={
+                'vectorSearchConfiguration': {'numberOfResults': _KB_RESULTS}
+            }
+        )
+        
+        return [
+            result['content']['text']
+            for result in response.get('retrievalResults', [])
+            if result.get('content', {}).get('text')
+        ]
+    
+    def _warm_starter(self, answer):
+        """Warm introduction for an answer that opens too clinically, or an empty string"""
+        if not answer or any(starter in answer.lower()[:50] for starter in ['i understand', 'great question', 'that\'s']):
+            return ""
+        
+        warm_starters = [
+            "Great question! ",
+            "I'm happy to help with that. ",
+            "That's important to know. ",
+            "Let me share what the medical guidelines tell us. "
+        ]
+        import random
+        return random.choice(warm_starters)
+    
+    def _stream_with_warm_starter(self, stream, on_text):
+        """
+        Pass a streamed answer on to on_text, led by its warm starter
+        
+        The starter depends on how the answer opens, so the first 50 characters
+        are held back until it is chosen; everything after flows straight through.
+        
+        Args:
+            stream (iterable): Pieces of the answer text
+            on_text (callable): Receives each piece of text to show
+            
+        Returns:
+            tuple: (answer without starter, starter)
+        """
+        chunks = []
+        starter = None
+        for text in stream:
+            chunks.append(text)
+            if starter is not None:
+                on_text(text)
+                continue
+            
+            head = ''.join(chunks)
+            if len(head) >= 50:
+                starter = self._warm_starter(head)
+                on_text(starter + head)
+        
+        answer = ''.join(chunks)
+        if starter is None:
+            # Short answer: it ended before the starter was chosen
+            starter = self._warm_starter(answer)
+            if answer:
+                on_text(starter + answer)
+        return answer, starter
+    
+    def process_knowledge_response(self, answer, citations, starter=None):
         """
         Process knowledge base response and add proper citations
         
         Args:
             answer (str): Raw answer from knowledge base
             citations (list): Citation information
+            starter (str): Warm introduction already chosen (and shown) while
+                streaming; picked here when None
             
         Returns:
             str: Enhanced answer with citations
         """
-        # Make the response warmer and more personal
-        if answer:
-            # Add a warm introduction if the response seems too clinical
-            if not any(starter in answer.lower()[:50] for starter in ['i understand', 'great question', 'that\'s']):
-                warm_starters = [
-                    "Great question! ",
-                    "I'm happy to help with that. ",
-                    "That's important to know. ",
-                    "Let me share what the medical guidelines tell us. "
-                ]
-                import random
-                starter = random.choice(warm_starters)
-                answer = starter + answer
+        # Make the response warmer and more personal: add a warm
+        # introduction if the response seems too clinical
+        if starter is None:
+            starter = self._warm_starter(answer)
+        answer = starter + answer
         
         # Add source information
         if citations and len(citations) > 0:
@@ -148,37 +267,6 @@ class KnowledgeEnhancedGlucoMate(MultilingualGlucoMate):
         
         return answer
     
-    def create_knowledge_enhanced_prompt(self, user_input, kb_response, language="English"):
-        """
-        Create prompt that combines knowledge base info with conversational tone
-        
-        Args:
-            user_input (str): Original user question
-            kb_response (str): Knowledge base response
-            language (str): Target language
-            
-        Returns:
-            str: Enhanced prompt for final response
-        """
-        
-        prompt = f"""You are GlucoMate, a warm and caring diabetes companion. A person asked: "{user_input}"
-
-You have this authoritative medical information from your knowledge base:
-{kb_response}
-
-Please rewrite this information in a warm, conversational, and supportive tone that:
-1. Keeps all the medical accuracy and important details
-2. Sounds like a knowledgeable friend, not a medical textbook
-3. Shows empathy and understanding
-4. Uses encouraging, supportive language
-5. Includes practical tips they can use
-6. Makes complex medical information easy to understand
-7. Maintains the source attribution
-
-Respond in {language} with a caring, personal touch while keeping all the medical accuracy:"""
-
-        return prompt
-    
     def knowledge_enhanced_chat(self, user_input, target_language_code, auto_detect=False):
         """
         Enhanced chat with knowledge base integration
@@ -192,9 +280,14 @@ Respond in {language} with a caring, personal touch while keeping all the medica
             str: Response with knowledge base enhancement
         """
         
+        # Catch obvious emergencies before paying for translation
+        emergency_language = self.detect_emergency_before_translation(user_input, target_language_code)
+        if emergency_language:
+            return self.get_emergency_message(emergency_language if auto_detect else target_language_code)
+        
         # Handle language detection (inherited)
         if auto_detect:
-            detected_language = self.detect_language(user_input)
+            detected_language = self.detect_language(user_input, default=target_language_code)
             if detected_language != target_language_code:
                 print(f"🔍 Detected language: {detected_language}")
                 target_language_code = detected_language
@@ -203,62 +296,51 @@ Respond in {language} with a caring, personal touch while keeping all the medica
         english_input = self.translate_to_english(user_input, target_language_code)
         
         # Safety check first (inherited)
-        safety_check = self.check_safety(english_input)
+        keyword_matches = self.scan_keywords(english_input)
+        safety_check = self.check_safety(english_input, keyword_matches)
         
         if safety_check['is_emergency']:
-            emergency_msg = safety_check['message']
-            if target_language_code != 'en':
-                emergency_msg = self.translate_response(emergency_msg, target_language_code)
-            return emergency_msg
+            return self.get_emergency_message(target_language_code)
         
         # Get language name for responses
-        language_name = "English"
-        for code, (name, lang_code) in self.supported_languages.items():
-            if lang_code == target_language_code:
-                language_name = name
-                break
+        language_name = self._lang_code_to_name.get(target_language_code, "English")
         
         # Determine if this needs knowledge base lookup
-        conversation_type = self.classify_conversation_type(english_input)
+        conversation_type = self.classify_conversation_type(english_input, keyword_matches)
         
         if conversation_type == "casual":
             # Use inherited multilingual chat for casual conversation
             return self.multilingual_chat(user_input, target_language_code, auto_detect)
         
-        # Try knowledge base for medical questions
+        # Try knowledge base for medical questions; English answers without a
+        # warning are shown as-is, so they can be streamed while generated
         print("🔍 Searching medical knowledge base...")
-        kb_response = self.query_medical_knowledge(english_input)
+        stream_output = target_language_code == 'en' and safety_check['urgency_level'] == 'NORMAL'
+        kb_response = self.query_medical_knowledge(
+            english_input, on_text=self.stream_callback if stream_output else None
+        )
         
         if kb_response:
-            # Enhance knowledge base response with conversational tone
-            enhancement_prompt = self.create_knowledge_enhanced_prompt(
-                english_input, kb_response, language_name
-            )
-            
-            response = self.call_bedrock_model(
-                enhancement_prompt, 
-                conversation_type="medical",
-                temperature=0.4  # Slightly higher for warmth while keeping accuracy
-            )
-            
-            print("✅ Enhanced response from knowledge base")
+            # Knowledge base answers are generated in a warm, conversational tone
+            response = kb_response
+            if not stream_output:
+                print("✅ Enhanced response from knowledge base")
         else:
             # Fallback to inherited multilingual functionality
             print("⚠️ Using multilingual fallback response")
             return self.multilingual_chat(user_input, target_language_code, auto_detect)
         
-        # Translate response if needed (inherited method)
-        if target_language_code != 'en':
-            response = self.enhance_medical_translation(response, target_language_code)
+        # Translate response and any safety warning together (inherited method)
+        warning_msg = None
+        if safety_check['urgency_level'] in ['HIGH', 'MODERATE']:
+            warning_msg = safety_check['message']
+        response, warning_msg = self.translate_turn(response, warning_msg, target_language_code)
         
         # Add medical disclaimer (inherited method)
         response = self.add_medical_disclaimer(response, language_name)
         
         # Add safety warnings if needed (inherited)
-        if safety_check['urgency_level'] in ['HIGH', 'MODERATE']:
-            warning_msg = safety_check['message']
-            if target_language_code != 'en':
-                warning_msg = self.translate_response(warning_msg, target_language_code)
+        if warning_msg:
             response = warning_msg + "\n\n" + response
         
         return response
@@ -281,7 +363,7 @@ Respond in {language} with a caring, personal touch while keeping all the medica
         """Get information about knowledge base usage"""
         return {
             'knowledge_base_id': self.knowledge_base_id,
-            'model_id': self.model_id,
+            'model_id': self.chat_model_id,
             'enhancement_terms': len(self.medical_query_enhancements)
         }
 
@@ -297,6 +379,7 @@ def main():
     print("   • All previous multilingual capabilities")
     
     bot = KnowledgeEnhancedGlucoMate()
+    bot.stream_to_terminal("📚 GlucoMate: ")
     
     # Test knowledge base connection
     if not bot.test_knowledge_base_connection():
@@ -320,7 +403,7 @@ def main():
     # Auto-detect option (inherited)
     auto_detect_prompt = "Enable automatic language detection? (y/n): "
     if language_code != 'en':
-        auto_detect_prompt = bot.translate_response(auto_detect_prompt, language_code)
+        auto_detect_prompt = bot.translate_static(auto_detect_prompt, language_code)
     auto_detect = input(f"🔍 {auto_detect_prompt}").lower().startswith('y')
     
     # Knowledge-focused suggestions
@@ -342,7 +425,7 @@ def main():
     
     exit_instruction = "Type 'quit' to exit"
     if language_code != 'en':
-        exit_instruction = bot.translate_response(exit_instruction, language_code)
+        exit_instruction = bot.translate_static(exit_instruction, language_code)
     print(f"\n{exit_instruction}")
     
     try:
@@ -357,12 +440,12 @@ def main():
             if user_input:
                 print("💭 Checking knowledge base and processing...")
                 response = bot.knowledge_enhanced_chat(user_input, language_code, auto_detect)
-                print(f"\n📚 GlucoMate: {response}")
+                bot.print_response(response, "📚 GlucoMate: ")
                 print("\n" + "─" * 60)
             else:
                 ready_msg = "I'm here with authoritative medical information whenever you need it!"
                 if language_code != 'en':
-                    ready_msg = bot.translate_response(ready_msg, language_code)
+                    ready_msg = bot.translate_static(ready_msg, language_code)
                 print(f"💭 {ready_msg}")
                 
     except KeyboardInterrupt:
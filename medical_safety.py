@@ -3,6 +3,97 @@ Medical Safety Guardrails for GlucoMate
 Handles emergency detection, warning signs, and medical disclaimers
 """
 
+import re
+from translations import UI_STRINGS
+
+class KeywordScanner:
+    """
+    Tags text with every keyword category it mentions in a single pass
+    
+    All keywords are compiled into one regex tried at every position, so
+    overlapping keywords (e.g. 'chest pain' inside 'severe chest pain') are
+    all found, just like the `keyword in text` checks it replaces.
+    """
+    
+    __slots__ = ('categories', 'whole_word_categories', '_pattern', '_hits')
+    
+    def __init__(self, categories=None):
+        self.categories = {}
+        self.whole_word_categories = set()
+        self._pattern = None
+        self._hits = {}
+        
+        for category, keywords in (categories or {}).items():
+            self.add(category, keywords)
+    
+    def add(self, category, keywords, whole_words=False):
+        """
+        Register keywords under a category (recompiled on next scan)
+        
+        Args:
+            category (str): Category name reported by scan()
+            keywords (list): Keywords to look for
+            whole_words (bool): Only match whole words ('new' but not 'knew')
+        """
+        self.categories.setdefault(category, []).extend(keyword.lower() for keyword in keywords)
+        if whole_words:
+            self.whole_word_categories.add(category)
+        self._pattern = None
+    
+    def _compile(self):
+        """Build the combined pattern and the keyword -> categories table"""
+        owners = {}
+        for category, keywords in self.categories.items():
+            for keyword in keywords:
+                owners.setdefault(keyword, []).append(category)
+        
+        # Only the longest keyword at each position is reported, so it also
+        # carries every shorter keyword that is a prefix of it
+        self._hits = {
+            keyword: [(category, prefix) for prefix in owners if keyword.startswith(prefix)
+                      for category in owners[prefix]]
+            for keyword in owners
+        }
+        
+        if owners:
+            alternation = '|'.join(re.escape(keyword) for keyword in sorted(owners, key=len, reverse=True))
+            self._pattern = re.compile(f'(?=({alternation}))')
+        else:
+            self._pattern = re.compile(r'(?!)')  # Never matches
+    
+    def scan(self, text):
+        """
+        Find all keyword categories present in text
+        
+        Args:
+            text (str): Text to scan
+            
+        Returns:
+            dict: category -> list of keywords found, in order of appearance
+        """
+        if self._pattern is None:
+            self._compile()
+        
+        text = text.lower()
+        found = {}
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for category, keyword in self._hits[match.group(1)]:
+                if category in self.whole_word_categories and not self._is_whole_word(text, start, len(keyword)):
+                    continue
+                keywords = found.setdefault(category, [])
+                if keyword not in keywords:
+                    keywords.append(keyword)
+        
+        return found
+    
+    @staticmethod
+    def _is_whole_word(text, start, length):
+        """Check that text[start:start + length] isn't part of a longer word"""
+        end = start + length
+        return ((start == 0 or not text[start - 1].isalnum()) and
+                (end == len(text) or not text[end].isalnum()))
+
 class MedicalSafetyGuardrails:
     def __init__(self):
         # Critical emergency keywords requiring immediate medical attention
@@ -52,11 +143,48 @@ class MedicalSafetyGuardrails:
             'sleep problems', 'can\'t sleep', 'insomnia',
             'appetite changes', 'not hungry', 'eating too much'
         ]
+        
+        # Medication-related concerns
+        self.medication_concern_keywords = [
+            'double dose', 'took twice', 'overdose', 'too much insulin',
+            'missed insulin', 'forgot medication', 'ran out of',
+            'expired medication', 'old insulin', 'medication reaction',
+            'allergic reaction', 'rash from', 'side effects'
+        ]
+        
+        # Messages shown for each urgency level
+        self.emergency_message = UI_STRINGS['en']['emergency']
+        self.warning_message = UI_STRINGS['en']['high_warning']
+        self.moderate_message = UI_STRINGS['en']['moderate_warning']
+        
+        # Medical disclaimer per language name, appended to medical answers
+        self.disclaimers = {
+            "English": "📋 **Medical Disclaimer**: This information is for educational purposes only and is not a substitute for professional medical advice, diagnosis, or treatment. Always consult your healthcare provider for medical decisions.",
+            "Spanish": "📋 **Descargo médico**: Esta información es solo para fines educativos y no sustituye el consejo, diagnóstico o tratamiento médico profesional. Siempre consulte a su proveedor de atención médica para decisiones médicas.",
+            "French": "📋 **Avertissement médical**: Ces informations sont uniquement à des fins éducatives et ne remplacent pas les conseils, diagnostics ou traitements médicaux professionnels. Consultez toujours votre professionnel de santé pour les décisions médicales.",
+            "Arabic": "📋 **إخلاء طبي**: هذه المعلومات لأغراض تعليمية فقط وليست بديلاً عن المشورة الطبية المهنية أو التشخيص أو العلاج. استشر دائماً مقدم الرعاية الصحية الخاص بك للقرارات الطبية.",
+            "Portuguese": "📋 **Aviso médico**: Esta informação é apenas para fins educacionais e não substitui aconselhamento, diagnóstico ou tratamento médico profissional. Sempre consulte seu profissional de saúde para decisões médicas.",
+            "German": "📋 **Medizinischer Haftungsausschluss**: Diese Informationen dienen nur Bildungszwecken und ersetzen keine professionelle medizinische Beratung, Diagnose oder Behandlung. Konsultieren Sie immer Ihren Arzt für medizinische Entscheidungen."
+        }
+        # Ready-to-append disclaimer text, built once rather than on every answer
+        self._disclaimer_suffixes = {language: f"\n\n{disclaimer}" for language, disclaimer in self.disclaimers.items()}
+        
+        # One scanner for every keyword list; other GlucoMate layers add their own categories
+        self.scanner = KeywordScanner({
+            'emergency': self.emergency_keywords,
+            'warning': self.warning_keywords,
+            'moderate': self.moderate_concern_keywords,
+            'medication': self.medication_concern_keywords
+        })
     
-    def check_emergency_situation(self, user_input):
+    def check_emergency_situation(self, user_input, matches=None):
         """
         Check for emergency, warning, or concerning situations
         
+        Args:
+            user_input (str): User's input
+            matches (dict): Result of scanner.scan(user_input), if already computed
+        
         Returns:
             dict: {
                 'is_emergency': bool,
@@ -65,47 +193,39 @@ class MedicalSafetyGuardrails:
                 'keywords_found': list
             }
         """
-        user_text = user_input.lower()
+        if matches is None:
+            matches = self.scanner.scan(user_input)
         
         # Check for emergency situations
-        emergency_found = []
-        for keyword in self.emergency_keywords:
-            if keyword in user_text:
-                emergency_found.append(keyword)
+        emergency_found = matches.get('emergency', [])
         
         if emergency_found:
             return {
                 'is_emergency': True,
                 'urgency_level': 'EMERGENCY',
-                'message': '🚨 **MEDICAL EMERGENCY**: What you\'re describing sounds like a serious medical emergency. Please call 911 (or your local emergency number) immediately or go to the nearest emergency room right now. Do not delay - your safety is the top priority.',
+                'message': self.emergency_message,
                 'keywords_found': emergency_found
             }
         
         # Check for high-priority warnings
-        warning_found = []
-        for keyword in self.warning_keywords:
-            if keyword in user_text:
-                warning_found.append(keyword)
+        warning_found = matches.get('warning', [])
         
         if warning_found:
             return {
                 'is_emergency': False,
                 'urgency_level': 'HIGH',
-                'message': '⚠️ **Important**: What you\'re describing needs prompt medical attention. Please contact your healthcare provider or diabetes care team as soon as possible today. If it\'s after hours, consider calling their emergency line or visiting an urgent care center.',
+                'message': self.warning_message,
                 'keywords_found': warning_found
             }
         
         # Check for moderate concerns
-        moderate_found = []
-        for keyword in self.moderate_concern_keywords:
-            if keyword in user_text:
-                moderate_found.append(keyword)
+        moderate_found = matches.get('moderate', [])
         
         if moderate_found:
             return {
                 'is_emergency': False,
                 'urgency_level': 'MODERATE',
-                'message': '💛 **Keep an eye on this**: What you\'re describing is worth monitoring. Consider discussing this with your healthcare provider at your next appointment, or sooner if it gets worse or doesn\'t improve.',
+                'message': self.moderate_message,
                 'keywords_found': moderate_found
             }
         
@@ -119,17 +239,7 @@ class MedicalSafetyGuardrails:
     
     def add_medical_disclaimer(self, response, language="English"):
         """Add appropriate medical disclaimer to response"""
-        disclaimers = {
-            "English": "📋 **Medical Disclaimer**: This information is for educational purposes only and is not a substitute for professional medical advice, diagnosis, or treatment. Always consult your healthcare provider for medical decisions.",
-            "Spanish": "📋 **Descargo médico**: Esta información es solo para fines educativos y no sustituye el consejo, diagnóstico o tratamiento médico profesional. Siempre consulte a su proveedor de atención médica para decisiones médicas.",
-            "French": "📋 **Avertissement médical**: Ces informations sont uniquement à des fins éducatives et ne remplacent pas les conseils, diagnostics ou traitements médicaux professionnels. Consultez toujours votre professionnel de santé pour les décisions médicales.",
-            "Arabic": "📋 **إخلاء طبي**: هذه المعلومات لأغراض تعليمية فقط وليست بديلاً عن المشورة الطبية المهنية أو التشخيص أو العلاج. استشر دائماً مقدم الرعاية الصحية الخاص بك للقرارات الطبية.",
-            "Portuguese": "📋 **Aviso médico**: Esta informação é apenas para fins educacionais e não substitui aconselhamento, diagnóstico ou tratamento médico profissional. Sempre consulte seu profissional de saúde para decisões médicas.",
-            "German": "📋 **Medizinischer Haftungsausschluss**: Diese Informationen dienen nur Bildungszwecken und ersetzen keine professionelle medizinische Beratung, Diagnose oder Behandlung. Konsultieren Sie immer Ihren Arzt für medizinische Entscheidungen."
-        }
-        
-        disclaimer = disclaimers.get(language, disclaimers["English"])
-        return response + f"\n\n{disclaimer}"
+        return response + self._disclaimer_suffixes.get(language, self._disclaimer_suffixes["English"])
     
     def get_emergency_contacts_message(self, country_code="US"):
         """Get emergency contact information based on location"""
@@ -166,17 +276,12 @@ class MedicalSafetyGuardrails:
         • If unconscious: DO NOT give anything by mouth - wait for emergency services
         """
     
-    def check_medication_interactions(self, user_input):
+    def check_medication_interactions(self, user_input, matches=None):
         """Check for potential medication-related concerns"""
-        medication_concerns = [
-            'double dose', 'took twice', 'overdose', 'too much insulin',
-            'missed insulin', 'forgot medication', 'ran out of',
-            'expired medication', 'old insulin', 'medication reaction',
-            'allergic reaction', 'rash from', 'side effects'
-        ]
+        if matches is None:
+            matches = self.scanner.scan(user_input)
         
-        user_text = user_input.lower()
-        found_concerns = [concern for concern in medication_concerns if concern in user_text]
+        found_concerns = matches.get('medication', [])
         
         if found_concerns:
             return {
@@ -4,10 +4,20 @@ Inherits: Bedrock core, safety, basic prompting
 Adds: Translation, language detection, cultural adaptation
 """
 
-import boto3
 import json
+import re
 import sys
+from functools import lru_cache
 from glucomate_core import GlucoMateCore
+from medical_safety import KeywordScanner
+from translations import UI_STRINGS
+
+_TRANSLATE_CACHE_MAX_CHARS = 500  # Longer texts are one-off answers, not worth caching
+
+# Local language detection helpers
+_ARABIC_SCRIPT_RE = re.compile(r'[\u0600-\u06FF\u0750-\u077F]')
+_WORD_RE = re.compile(r"[\w']+")
+_LETTER_RE = re.compile(r'[^\W\d_]')  # Any letter, in any script
 
 class MultilingualGlucoMate(GlucoMateCore):
     """
@@ -43,6 +53,8 @@ class MultilingualGlucoMate(GlucoMateCore):
             }
         }
         
+        self._medical_term_scanner = KeywordScanner({'term': list(self.medical_terms)})
+        
         # Cultural dietary considerations
         self.cultural_food_context = {
             'ar': 'Consider Middle Eastern and Arab dietary preferences (dates, rice, lamb, Mediterranean diet)',
@@ -53,32 +65,177 @@ class MultilingualGlucoMate(GlucoMateCore):
             'en': 'Consider diverse dietary preferences and accessibility of ingredients'
         }
         
+        # Common English function words for spotting English input without a Translate call.
+        # Words that are also common in another supported language (German 'was', 'will') are left out
+        self.english_markers = {
+            'the', 'is', 'are', 'what', 'how', 'why', 'when', 'which', 'my',
+            'and', 'of', 'to', 'can', 'does', 'should', 'with', 'for', 'about',
+            'you', 'your', 'have', 'this', 'that', 'i', "i'm", 'it', 'be'
+        }
+        
+        # Emergency phrases in every supported language, checked on raw input. Only
+        # translations of the safety layer's emergency keywords belong here, so this
+        # shortcut never fires on input the full English check would let through
+        self.emergency_phrases = {
+            'en': list(self.safety.emergency_keywords),
+            'ar': ['ألم في الصدر', 'ألم الصدر', 'لا أستطيع التنفس', 'فاقد الوعي', 'فقدان الوعي',
+                   'إغماء', 'تشنجات', 'الحماض الكيتوني السكري'],
+            'fr': ['douleur thoracique', 'douleur à la poitrine', 'je ne peux pas respirer',
+                   'inconscient', 'évanoui', 'convulsions', 'acidocétose diabétique'],
+            'es': ['dolor en el pecho', 'dolor de pecho', 'no puedo respirar', 'inconsciente',
+                   'desmayado', 'convulsión', 'convulsiones', 'cetoacidosis diabética'],
+            'pt': ['dor no peito', 'não consigo respirar', 'inconsciente', 'desmaiou', 'desmaiado',
+                   'convulsão', 'convulsões', 'cetoacidose diabética'],
+            'de': ['brustschmerzen', 'schmerzen in der brust', 'kann nicht atmen', 'bekomme keine luft',
+                   'bewusstlos', 'ohnmächtig', 'krampfanfall', 'diabetische ketoazidose']
+        }
+        self._emergency_re = {
+            code: re.compile('|'.join(re.escape(phrase) for phrase in phrases), re.IGNORECASE)
+            for code, phrases in self.emergency_phrases.items()
+        }
+        # All languages in one pattern, so ordinary input is cleared in a single pass
+        self._multilingual_emergency_re = re.compile(
+            '|'.join(pattern.pattern for pattern in self._emergency_re.values()),
+            re.IGNORECASE
+        )
+        
+        # Common words and letters per Latin-script language, for detecting the
+        # input language locally (Arabic is recognized by its script)
+        self.language_markers = {
+            'en': self.english_markers | {'hello', 'hi', 'thanks', 'thank', 'please', 'blood', 'sugar'},
+            'fr': {'le', 'la', 'les', 'des', 'du', 'est', 'et', 'je', 'vous', 'mon', 'ma', 'mes',
+                   'pour', 'avec', 'pas', 'une', 'quoi', 'comment', 'suis', 'bonjour', 'merci',
+                   'sucre', 'glycémie', "j'ai", "c'est", 'sang'},
+            'es': {'el', 'los', 'las', 'es', 'y', 'yo', 'mi', 'mis', 'qué', 'cómo', 'está',
+                   'estoy', 'puedo', 'debo', 'azúcar', 'sangre', 'del', 'por', 'hola', 'gracias', 'tengo'},
+            'pt': {'o', 'os', 'é', 'eu', 'meu', 'minha', 'você', 'não', 'estou', 'posso', 'devo',
+                   'açúcar', 'sangue', 'da', 'olá', 'oi', 'obrigado', 'obrigada', 'tenho'},
+            'de': {'der', 'die', 'das', 'ist', 'und', 'ich', 'mein', 'meine', 'nicht', 'mit', 'für',
+                   'wie', 'was', 'ein', 'eine', 'kann', 'soll', 'bin', 'habe', 'hallo', 'danke',
+                   'zucker', 'blutzucker'}
+        }
+        self.language_letters = {
+            'fr': set('èêàùœëç'),
+            'es': set('ñ¿¡'),
+            'pt': set('ãõç'),
+            'de': set('ßäöü')
+        }
+        # Any of these in ASCII input means it is not plain English
+        self._foreign_markers = set().union(
+            *(markers for code, markers in self.language_markers.items() if code != 'en')
+        )
+        
+        # Translations of fixed English strings, {language_code: {text: translation}}.
+        # Seeded from the shipped UI_STRINGS table; anything else is filled once per language
+        english_strings = UI_STRINGS['en']
+        self._static_translations = {
+            code: {english_strings[key]: text for key, text in strings.items()}
+            for code, strings in UI_STRINGS.items() if code != 'en'
+        }
+        
+        # Memoized Translate calls, so repeated phrases are served from memory.
+        # Wrapping the bound method keeps the cache per instance
+        self._translate_cached = lru_cache(maxsize=1024)(self._call_translate)
+        
         print("🌍 GlucoMate Level 2: Multilingual support loaded")
     
-    def detect_language(self, text):
+    def detect_language(self, text, default='en'):
         """
-        Detect the language of user input
+        Detect the language of user input locally, without a network call
+        
+        Arabic is recognized by its script; the Latin-script languages by their
+        common words and accented letters.
         
         Args:
             text (str): Text to analyze
+            default (str): Language code to return when the text is ambiguous
             
         Returns:
             str: Language code (en, ar, fr, etc.)
         """
-        try:
-            response = self.translate_client.detect_dominant_language(Text=text)
-            detected_lang = response['Languages'][0]['LanguageCode']
-            confidence = response['Languages'][0]['Score']
+        if _ARABIC_SCRIPT_RE.search(text):
+            return 'ar'
+        
+        text_lower = text.lower()
+        words = _WORD_RE.findall(text_lower)
+        scores = {
+            code: sum(1 for word in words if word in markers)
+            for code, markers in self.language_markers.items()
+        }
+        for code, letters in self.language_letters.items():
+            if not letters.isdisjoint(text_lower):
+                scores[code] += 1
+        
+        # Only trust a clear winner
+        best = max(scores, key=scores.get)
+        if scores[best] == 0 or list(scores.values()).count(scores[best]) > 1:
+            return default
+        return best
+    
+    def looks_like_english(self, text):
+        """
+        Cheap local check for input that is already English
+        
+        Many users who picked another language still type their questions in
+        English; this avoids paying a Translate round-trip for them. Text with
+        any common French, Spanish, Portuguese or German word is never treated
+        as English, so "Was ist Diabetes?" still gets translated.
+        
+        Args:
+            text (str): Text to analyze
             
-            # Only use detection if confidence is high
-            if confidence > 0.8:
-                return detected_lang
-            else:
-                return 'en'  # Default to English if uncertain
-                
-        except Exception as e:
-            print(f"🔍 Language detection failed: {e}")
-            return 'en'  # Default to English on error
+        Returns:
+            bool: True if the text is ASCII and reads like English
+        """
+        if not text.isascii():
+            return False
+        
+        words = [word.strip('?!.,;:"()') for word in text.lower().split()]
+        words = [word for word in words if word]
+        if not words:
+            return False
+        
+        if any(word in self._foreign_markers for word in words):
+            return False
+        
+        hits = sum(1 for word in words if word in self.english_markers)
+        return hits >= 1 and hits / len(words) >= 0.25
+    
+    def detect_emergency_before_translation(self, user_input, preferred_language='en'):
+        """
+        Spot clear emergencies in any supported language without translating
+        
+        Every second matters on this path, so the raw input is checked first
+        and the Translate round-trip is only paid when nothing matches.
+        
+        Args:
+            user_input (str): User's input in their own language
+            preferred_language (str): Language to credit when a phrase is shared
+                (e.g. 'inconsciente' in Spanish and Portuguese)
+            
+        Returns:
+            str: Language code of the emergency phrase found, or None
+        """
+        if not self._multilingual_emergency_re.search(user_input):
+            return None
+        
+        found = {}
+        for code, pattern in self._emergency_re.items():
+            match = pattern.search(user_input)
+            if match:
+                found[code] = len(match.group(0))
+        if preferred_language in found:
+            return preferred_language
+        
+        # A phrase inside a longer one ('inconscient' in 'inconsciente') belongs to the longer one's language
+        longest = max(found.values())
+        candidates = [code for code, length in found.items() if length == longest]
+        detected = self.detect_language(user_input, default=candidates[0])
+        return detected if detected in candidates else candidates[0]
+    
+    def get_emergency_message(self, target_language):
+        """Emergency message in the user's language"""
+        return self.translate_static(self.safety.emergency_message, target_language)
     
     def translate_to_english(self, text, source_language):
         """
@@ -91,16 +248,11 @@ class MultilingualGlucoMate(GlucoMateCore):
         Returns:
             str: Translated text or original if translation fails
         """
-        if source_language == 'en':
+        if source_language == 'en' or len(text.strip()) < 3 or self.looks_like_english(text):
             return text
         
         try:
-            response = self.translate_client.translate_text(
-                Text=text,
-                SourceLanguageCode=source_language,
-                TargetLanguageCode='en'
-            )
-            translated = response['TranslatedText']
+            translated = self._translate(text, source_language, 'en')
             print(f"🔄 Translated from {source_language}: '{text}' → '{translated}'")
             return translated
             
@@ -119,25 +271,85 @@ class MultilingualGlucoMate(GlucoMateCore):
         Returns:
             str: Translated text or original if translation fails
         """
-        if target_language == 'en':
+        # Nothing worth a round-trip (empty text, emoji or markdown without words)
+        if target_language == 'en' or len(text.strip()) < 3 or not _LETTER_RE.search(text):
             return text
         
         try:
-            # Use formal tone for medical content
-            response = self.translate_client.translate_text(
-                Text=text,
-                SourceLanguageCode='en',
-                TargetLanguageCode=target_language,
-                Settings={
-                    'Formality': 'FORMAL'  # Use formal tone for medical content
-                }
-            )
-            return response['TranslatedText']
+            return self._translate(text, 'en', target_language)
             
         except Exception as e:
             print(f"❌ Translation to {target_language} failed: {e}")
             return text  # Return original if translation fails
     
+    def _translate(self, text, source_language, target_language):
+        """
+        Translate text, serving short phrases from the in-memory cache
+        
+        Greetings, fallback messages and other short phrases repeat across turns
+        and stay cached. Full answers are rarely repeated, so they skip the cache
+        instead of pushing those phrases out.
+        """
+        if len(text) <= _TRANSLATE_CACHE_MAX_CHARS:
+            return self._translate_cached(text, source_language, target_language)
+        return self._call_translate(text, source_language, target_language)
+    
+    def _call_translate(self, text, source_language, target_language):
+        """Single AWS Translate request; call through _translate instead"""
+        request = {
+            'Text': text,
+            'SourceLanguageCode': source_language,
+            'TargetLanguageCode': target_language
+        }
+        if target_language != 'en':
+            request['Settings'] = {'Formality': 'FORMAL'}  # Use formal tone for medical content
+        
+        return self.call_aws('translate_client', 'translate_text', **request)['TranslatedText']
+    
+    def translate_static(self, text, target_language):
+        """
+        Translate a fixed English string once per language and reuse it
+        
+        Args:
+            text (str): English text that never changes between turns
+            target_language (str): Target language code
+            
+        Returns:
+            str: Translated text or original if translation fails
+        """
+        if target_language == 'en':
+            return text
+        
+        cached = self._static_translations.setdefault(target_language, {})
+        if text not in cached:
+            translated = self.translate_response(text, target_language)
+            if translated is text:
+                return text  # Translation failed, try again next time
+            cached[text] = translated
+        
+        return cached[text]
+    
+    def translate_turn(self, response, warning_msg, target_language):
+        """
+        Translate a response and its optional safety warning
+        
+        Warnings are fixed messages that ship pre-translated for every
+        supported language, so only the response costs a Translate call.
+        
+        Args:
+            response (str): English response
+            warning_msg (str): English warning or None
+            target_language (str): Target language code
+            
+        Returns:
+            tuple: (translated_response, translated_warning)
+        """
+        if target_language == 'en':
+            return response, warning_msg
+        
+        translated_warning = self.translate_static(warning_msg, target_language) if warning_msg else None
+        return self.enhance_medical_translation(response, target_language), translated_warning
+    
     def create_culturally_aware_prompt(self, user_input, language_code, language_name):
         """
         Create prompts that are culturally sensitive
@@ -188,15 +400,19 @@ class MultilingualGlucoMate(GlucoMateCore):
         translated = self.translate_response(text, target_language)
         
         # Then enhance with medical term corrections if needed
-        for english_term, translations in self.medical_terms.items():
-            if english_term.lower() in text.lower():
-                if target_language in translations:
-                    correct_term = translations[target_language]
-                    # This is a simplified approach - in production you'd use more sophisticated term replacement
-                    print(f"🏥 Enhanced medical term: {english_term} → {correct_term}")
+        self.check_medical_terms(text, target_language)
         
         return translated
     
+    def check_medical_terms(self, text, target_language):
+        """Note medical terms whose translation should be checked"""
+        for english_term in self._medical_term_scanner.scan(text).get('term', []):
+            translations = self.medical_terms[english_term]
+            if target_language in translations:
+                correct_term = translations[target_language]
+                # This is a simplified approach - in production you'd use more sophisticated term replacement
+                print(f"🏥 Enhanced medical term: {english_term} → {correct_term}")
+    
     def multilingual_chat(self, user_input, target_language_code, auto_detect=False):
         """
         Enhanced chat with full multilingual support
@@ -210,10 +426,15 @@ class MultilingualGlucoMate(GlucoMateCore):
             str: Response in target language
         """
         
+        # Catch obvious emergencies before paying for translation
+        emergency_language = self.detect_emergency_before_translation(user_input, target_language_code)
+        if emergency_language:
+            return self.get_emergency_message(emergency_language if auto_detect else target_language_code)
+        
         # Auto-detect language if enabled
         detected_language = target_language_code
         if auto_detect:
-            detected_language = self.detect_language(user_input)
+            detected_language = self.detect_language(user_input, default=target_language_code)
             if detected_language != target_language_code:
                 print(f"🔍 Detected language: {detected_language} (you selected {target_language_code})")
                 # Use detected language if confidence is high
@@ -223,24 +444,17 @@ class MultilingualGlucoMate(GlucoMateCore):
         english_input = self.translate_to_english(user_input, target_language_code)
         
         # Use inherited safety check
-        safety_check = self.check_safety(english_input)
+        keyword_matches = self.scan_keywords(english_input)
+        safety_check = self.check_safety(english_input, keyword_matches)
         
         if safety_check['is_emergency']:
-            emergency_msg = safety_check['message']
-            # Translate emergency message to user's language
-            if target_language_code != 'en':
-                emergency_msg = self.translate_response(emergency_msg, target_language_code)
-            return emergency_msg
+            return self.get_emergency_message(target_language_code)
         
         # Get language name for prompt
-        language_name = "English"
-        for code, (name, lang_code) in self.supported_languages.items():
-            if lang_code == target_language_code:
-                language_name = name
-                break
+        language_name = self._lang_code_to_name.get(target_language_code, "English")
         
         # Create culturally-aware prompt
-        conversation_type = self.classify_conversation_type(english_input)
+        conversation_type = self.classify_conversation_type(english_input, keyword_matches)
         
         if conversation_type == "casual":
             # Use inherited base prompt for casual conversation
@@ -255,22 +469,28 @@ class MultilingualGlucoMate(GlucoMateCore):
                 english_input, target_language_code, language_name
             )
         
-        # Get response from Bedrock (inherited method)
-        response = self.call_bedrock_model(prompt, conversation_type=conversation_type)
+        # Get response from Bedrock (inherited method); English answers without
+        # a warning are shown as-is, so they can be streamed while generated
+        stream_output = target_language_code == 'en' and safety_check['urgency_level'] == 'NORMAL'
+        response = self.call_bedrock_model(
+            prompt,
+            conversation_type=conversation_type,
+            max_tokens=self.estimate_max_tokens(english_input, conversation_type, keyword_matches),
+            on_text=self.stream_callback if stream_output else None
+        )
         
-        # Enhance translation with medical terms
-        if target_language_code != 'en':
-            response = self.enhance_medical_translation(response, target_language_code)
+        # Translate response and any warning with medical terms enhanced
+        warning_msg = None
+        if safety_check['urgency_level'] in ['HIGH', 'MODERATE']:
+            warning_msg = safety_check['message']
+        response, warning_msg = self.translate_turn(response, warning_msg, target_language_code)
         
         # Add disclaimer in appropriate language (inherited method)
         if conversation_type == "medical":
             response = self.add_medical_disclaimer(response, language_name)
         
         # Add warning if needed (inherited safety check)
-        if safety_check['urgency_level'] in ['HIGH', 'MODERATE']:
-            warning_msg = safety_check['message']
-            if target_language_code != 'en':
-                warning_msg = self.translate_response(warning_msg, target_language_code)
+        if warning_msg:
             response = warning_msg + "\n\n" + response
         
         return response
@@ -311,6 +531,7 @@ def main():
     print("   • Emergency responses in your language")
     
     bot = MultilingualGlucoMate()
+    bot.stream_to_terminal("🌍 GlucoMate: ")
     
     # Language selection
     print(f"\n🌍 I can chat with you in multiple languages!")
@@ -325,7 +546,7 @@ def main():
     # Auto-detect option
     auto_detect_prompt = "Enable automatic language detection? (y/n): "
     if language_code != 'en':
-        auto_detect_prompt = bot.translate_response(auto_detect_prompt, language_code)
+        auto_detect_prompt = bot.translate_static(auto_detect_prompt, language_code)
     
     auto_detect = input(f"🔍 {auto_detect_prompt}").lower().startswith('y')
     
@@ -347,7 +568,7 @@ def main():
     
     exit_instruction = "Type 'quit' to exit"
     if language_code != 'en':
-        exit_instruction = bot.translate_response(exit_instruction, language_code)
+        exit_instruction = bot.translate_static(exit_instruction, language_code)
     print(f"\n{exit_instruction}")
     
     try:
@@ -362,12 +583,12 @@ def main():
             if user_input:
                 print("💭 Processing in multiple languages...")
                 response = bot.multilingual_chat(user_input, language_code, auto_detect)
-                print(f"\n🌍 GlucoMate: {response}")
+                bot.print_response(response, "🌍 GlucoMate: ")
                 print("\n" + "─" * 60)
             else:
                 ready_msg = "I'm here whenever you're ready to chat!"
                 if language_code != 'en':
-                    ready_msg = bot.translate_response(ready_msg, language_code)
+                    ready_msg = bot.translate_static(ready_msg, language_code)
                 print(f"💭 {ready_msg}")
                 
     except KeyboardInterrupt:
@@ -4,7 +4,6 @@ Inherits: Bedrock core, safety, multilingual, knowledge base, smart search
 Adds: Patient profiles, medication tracking, personalized responses
 """
 
-import boto3
 import json
 import sys
 import os
@@ -14,6 +13,81 @@ import time
 from datetime import datetime, timedelta
 from smart_search_glucomate import SmartMedicalSearchGlucoMate
 
+try:
+    # Faster JSON when installed; the standard library gives the same results
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    """Parse JSON with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Profile fields that mean nothing to the model
+_PROFILE_SKIP_KEYS = frozenset({'patient_id', 'created_at', 'updated_at'})
+
+_SEMI_PERSONALIZED_TEMPLATE = """Create a diabetes response using this partial patient information:
+
+Available Patient Data:
+{patient_data}
+
+User Request: {user_input}
+
+Provide helpful advice that incorporates what we know about the patient while being clear about what additional information would help give even better guidance."""
+
+def _medication_text(row):
+    """'Metformin 500mg twice daily at 08:00, 20:00' from a medications row"""
+    # (id, patient_id, name, dosage, frequency, time_slots, ...)
+    text = " ".join(str(part) for part in row[2:5] if part)
+    if row[5]:
+        try:
+            times = _json_loads(row[5])
+        except ValueError:
+            times = row[5]  # Not JSON, keep the stored schedule as written
+        if not isinstance(times, list):
+            times = [times]
+        if times:
+            text += " at " + ", ".join(str(time_slot) for time_slot in times)
+    return text
+
+def _reading_text(row):
+    """'142 mg/dL (fasting, 2024-05-01)' from a glucose_readings row"""
+    # (id, patient_id, reading, timestamp, meal_context, notes)
+    context = [part for part in (row[4], str(row[3])[:10] if row[3] else None, row[5]) if part]
+    if context:
+        return f"{row[2]:g} mg/dL ({', '.join(context)})"
+    return f"{row[2]:g} mg/dL"
+
+def _profile_lines(profile):
+    """
+    Patient profile as a short bulleted list for prompts
+    
+    Plain "- Label: value" lines carry the same facts as indented JSON in
+    far fewer tokens. Database rows are reduced to their meaningful columns.
+    """
+    lines = []
+    for key, value in profile.items():
+        if key in _PROFILE_SKIP_KEYS or value is None or value == []:
+            continue
+        
+        label = key.replace('_', ' ').capitalize()
+        if key == 'medications':
+            value = "; ".join(_medication_text(row) for row in value)
+        elif key == 'recent_readings':
+            # Meal context and date keep each reading clinically meaningful
+            value = "; ".join(_reading_text(row) for row in value)
+            label += " (newest first)"
+        elif key == 'meal_preferences':
+            # (id, patient_id, preferred, disliked, cultural, budget, skills, prep time, ...)
+            value = "; ".join(str(part) for part in value[2:8] if part)
+            if not value:
+                continue
+        
+        lines.append(f"- {label}: {value}")
+    return "\n".join(lines)
+
 class PatientDatabase:
     """Database handler for patient information"""
     
@@ -292,7 +366,7 @@ class PersonalizedGlucoMate(SmartMedicalSearchGlucoMate):
             
             if time_slots:
                 try:
-                    times = json.loads(time_slots)
+                    times = _json_loads(time_slots)
                     for time_slot in times:
                         # Check if within 5 minutes of medication time
                         if abs(self._time_difference_minutes(current_hour_minute, time_slot)) <= 2:
@@ -677,18 +751,9 @@ class PersonalizedGlucoMate(SmartMedicalSearchGlucoMate):
     def generate_semi_personalized_response(self, user_input, target_language_code):
         """Generate response with partial profile data"""
         profile = self.patient_profile
-        available_info = {k: v for k, v in profile.items() if v is not None}
-        
-        response_prompt = f"""
-        Create a diabetes response using this partial patient information:
-        
-        Available Patient Data:
-        {json.dumps(available_info, indent=2)}
-        
-        User Request: {user_input}
-        
-        Provide helpful advice that incorporates what we know about the patient while being clear about what additional information would help give even better guidance.
-        """
+        response_prompt = _SEMI_PERSONALIZED_TEMPLATE.format(
+            patient_data=_profile_lines(profile), user_input=user_input
+        )
         
         response = self.call_bedrock_model(response_prompt, conversation_type="medical")
         
@@ -697,7 +762,7 @@ class PersonalizedGlucoMate(SmartMedicalSearchGlucoMate):
         
         if target_language_code != 'en':
             response = self.enhance_medical_translation(response, target_language_code)
-            completion_offer = self.translate_response(completion_offer, target_language_code)
+            completion_offer = self.translate_static(completion_offer, target_language_code)
         
         return response + completion_offer
 
@@ -785,7 +850,7 @@ def main():
     
     exit_instruction = "Type 'quit' to exit"
     if language_code != 'en':
-        exit_instruction = bot.translate_response(exit_instruction, language_code)
+        exit_instruction = bot.translate_static(exit_instruction, language_code)
     print(f"\n{exit_instruction}")
     
     try:
@@ -796,11 +861,10 @@ def main():
                 if bot.patient_profile:
                     name = bot.patient_profile.get('name', 'there')
                     farewell = f"Take care, {name}! Keep up the great work managing your diabetes. I'll be here whenever you need personalized support! 🌟"
+                    farewell = bot.translate_response(farewell, language_code)
                 else:
+                    # Already written in the user's language
                     farewell = bot.get_cultural_farewell(language_code)
-                
-                if language_code != 'en':
-                    farewell = bot.translate_response(farewell, language_code)
                 print(f"\n💙 GlucoMate: {farewell}")
                 break
             
@@ -811,7 +875,7 @@ def main():
             else:
                 ready_msg = "I'm here with personalized care whenever you need me!"
                 if language_code != 'en':
-                    ready_msg = bot.translate_response(ready_msg, language_code)
+                    ready_msg = bot.translate_static(ready_msg, language_code)
                 print(f"💭 {ready_msg}")
                 
     except KeyboardInterrupt:
@@ -0,0 +1,153 @@
+"""
+Response caching for GlucoMate
+Keeps recent answers from slow external services (web search, knowledge base)
+so repeated questions don't pay for another round-trip
+"""
+
+import hashlib
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+
+def normalize_query(query):
+    """Lowercase and collapse whitespace so trivially different questions share a key"""
+    return re.sub(r"\s+", " ", query.strip().lower())
+
+def query_cache_key(query):
+    """Compact cache key for a question"""
+    return hashlib.blake2b(normalize_query(query).encode('utf-8'), digest_size=16).hexdigest()
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after a fixed time
+
+    Safe to share between the chat thread and the I/O worker threads.
+    """
+    
+    __slots__ = ('maxsize', 'ttl', '_entries', '_lock')
+
+    def __init__(self, maxsize=1024, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+# Words that don't change what a question is about
+_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'am', 'do', 'does', 'did',
+    'i', 'me', 'my', 'we', 'our', 'you', 'your', 'it', 'its', 'this', 'that',
+    'what', 'which', 'how', 'please', 'tell', 'about', 'of', 'to', 'for', 'in',
+    'on', 'with', 'and', 'or', 'can', 'could', 'should', 'would', 'some', 'any'
+})
+_WORD_RE = re.compile(r"[\w']+")
+
+def query_terms(query):
+    """Content words of a question, used to spot rewordings"""
+    return frozenset(word for word in _WORD_RE.findall(normalize_query(query)) if word not in _STOPWORDS)
+
+class SemanticCache:
+    """
+    Finished answers to recent questions, matched by their content words
+    
+    Questions share an answer only when they have exactly the same content
+    words, ignoring order, case and filler words, so "what foods are good for
+    diabetes" also finds "good foods for diabetes". A single differing word
+    ("type 1"/"type 2", "good"/"bad", "eat"/"not eat") is always a miss: for
+    medical answers a wrong reuse is worse than a fresh lookup.
+    When full, the entry with the lowest score 0.6 * frequency + 0.4 * recency
+    is evicted.
+    """
+    
+    __slots__ = ('maxsize', 'ttl', 'recency_scale', '_entries', '_lock')
+
+    def __init__(self, maxsize=500, ttl=3600, recency_scale=1800):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.recency_scale = recency_scale  # Seconds for the recency score to fall to 1/e
+        self._entries = {}  # (language, terms) -> [created_at, hits, answer]
+        self._lock = threading.Lock()
+
+    def get(self, query, language):
+        """Return the answer to a cached question with the same content words, or None"""
+        terms = query_terms(query)
+        if not terms:
+            return None
+
+        key = (language, terms)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] + self.ttl < time.monotonic():
+                del self._entries[key]
+                return None
+
+            entry[1] += 1
+            return entry[2]
+
+    def set(self, query, language, answer):
+        """Store the finished answer to a question"""
+        terms = query_terms(query)
+        if not terms:
+            return
+
+        with self._lock:
+            key = (language, terms)
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._evict()
+            self._entries[key] = [time.monotonic(), 0, answer]
+
+    def _evict(self):
+        """Drop the entry that is least used and least recent"""
+        now = time.monotonic()
+        max_hits = max(entry[1] for entry in self._entries.values()) or 1
+
+        def keep_score(item):
+            created_at, hits, _ = item[1]
+            return 0.6 * hits / max_hits + 0.4 * math.exp(-(now - created_at) / self.recency_scale)
+
+        del self._entries[min(self._entries.items(), key=keep_score)[0]]
+
+    def clear(self):
+        """Drop every cached answer"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
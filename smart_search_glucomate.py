@@ -4,17 +4,77 @@ Inherits: Bedrock core, safety, multilingual, knowledge base
 Adds: Google Custom Search, real-time research, query classification
 """
 
-import boto3
-import json
 import sys
 import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from datetime import datetime
-from dotenv import load_dotenv
-from googleapiclient.discovery import build
+from functools import lru_cache
+from urllib.parse import urlsplit
 from knowledge_enhanced_glucomate import KnowledgeEnhancedGlucoMate
+from response_cache import SemanticCache, TTLCache, query_cache_key
 
-# Load environment variables
-load_dotenv()
+# Static instructions for synthesizing web search results
+_SEARCH_SYNTHESIS_PROMPT = (
+    "You are GlucoMate, a warm and caring diabetes companion. Answer the question "
+    "after <<QUERY>> from the current medical sources after <<SOURCES>>, favouring "
+    "those marked (trusted). Open with a brief caring acknowledgment, then give accurate, "
+    "practical information in plain, friendly language and mention when it is recent."
+)
+
+# Search snippets are cut to this length before going into the prompt
+_SNIPPET_MAX_CHARS = 200
+
+# Seconds before a Custom Search request is abandoned
+_SEARCH_HTTP_TIMEOUT = 5
+
+# Trusted medical domains for source verification
+_TRUSTED_DOMAINS = {
+    'diabetes.org': 'American Diabetes Association',
+    'who.int': 'World Health Organization',
+    'cdc.gov': 'Centers for Disease Control',
+    'nih.gov': 'National Institutes of Health',
+    'pubmed.ncbi.nlm.nih.gov': 'PubMed Medical Research',
+    'mayoclinic.org': 'Mayo Clinic',
+    'clevelandclinic.org': 'Cleveland Clinic',
+    'joslin.org': 'Joslin Diabetes Center',
+    'niddk.nih.gov': 'National Institute of Diabetes',
+    'jdrf.org': 'JDRF (Type 1 Diabetes Research)',
+    'diabetesresearch.org': 'Diabetes Research Institute'
+}
+
+@lru_cache(maxsize=256)
+def _trusted_domain(host):
+    """
+    Trusted domain a host belongs to, or None (memoized, hosts repeat across searches)
+    
+    Subdomains count, so 'www.cdc.gov' and 'www.niddk.nih.gov' are trusted too.
+    """
+    labels = host.split('.')
+    for i in range(len(labels) - 1):
+        domain = '.'.join(labels[i:])
+        if domain in _TRUSTED_DOMAINS:
+            return domain
+    return None
+
+def _link_host(link):
+    """Lowercased host of a result link ('' if it has none), or None if the link is missing or malformed"""
+    if not link:
+        return None
+    try:
+        # hostname drops any port or credentials
+        return urlsplit(link).hostname or ''
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=256)
+def _source_name(domain):
+    """Friendly source name for a domain (memoized, results repeat across searches)"""
+    trusted = _trusted_domain(domain)
+    if trusted:
+        return _TRUSTED_DOMAINS[trusted]
+    return f"medical website ({domain})"
 
 class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
     """
@@ -26,21 +86,30 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
     def __init__(self):
         super().__init__()  # Get ALL previous functionality
         
-        # Get search credentials from environment variables
+        # Get search credentials from environment variables (.env is loaded by GlucoMateCore)
         self.google_api_key = os.getenv('GOOGLE_API_KEY')
         self.search_engine_id = os.getenv('SEARCH_ENGINE_ID')
         
-        # Initialize Google Search
+        # Google Search is built on first search so startup doesn't wait on it
         self.search_service = None
-        try:
-            if self.google_api_key and self.search_engine_id:
-                self.search_service = build("customsearch", "v1", developerKey=self.google_api_key)
-                print("🔍 Connected to trusted medical search sources")
-            else:
-                print("💭 Web search not configured - using knowledge base only")
-        except Exception as e:
-            self.search_service = None
-            print(f"💭 Search temporarily unavailable: {str(e)[:50]}...")
+        self._search_attempted = False
+        # Keep-alive HTTP connection per worker thread (httplib2.Http isn't thread-safe)
+        self._search_http = threading.local()
+        
+        # Recent synthesized search answers, keyed by normalized question
+        self._search_cache = TTLCache(maxsize=1024, ttl=3600)
+        
+        # Finished answers per language, reused for the same question reworded
+        self._answer_cache = SemanticCache(maxsize=500, ttl=3600)
+        self.search_configured = bool(self.google_api_key and self.search_engine_id)
+        if self.search_configured:
+            print("🔍 Trusted medical search configured")
+        else:
+            print("💭 Web search not configured - using knowledge base only")
+        
+        # Worker threads for overlapping slow network calls (search, knowledge base)
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="glucomate-io")
+        self.source_race_timeout = 10  # Seconds to wait for web search / knowledge base
         
         # Current information indicators
         self.current_info_keywords = [
@@ -49,41 +118,38 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
             'this year', 'recently', 'just released', 'emerging'
         ]
         
+        # Signs the person could use some encouragement
+        self.distress_keywords = ['scared', 'worried', 'difficult', 'hard', 'confused']
+        
+        self.keyword_scanner.add('current_info', self.current_info_keywords, whole_words=True)
+        self.keyword_scanner.add('distress', self.distress_keywords, whole_words=True)
+        
         # Trusted medical domains for source verification
-        self.trusted_domains = {
-            'diabetes.org': 'American Diabetes Association',
-            'who.int': 'World Health Organization',
-            'cdc.gov': 'Centers for Disease Control',
-            'nih.gov': 'National Institutes of Health',
-            'pubmed.ncbi.nlm.nih.gov': 'PubMed Medical Research',
-            'mayoclinic.org': 'Mayo Clinic',
-            'clevelandclinic.org': 'Cleveland Clinic',
-            'joslin.org': 'Joslin Diabetes Center',
-            'niddk.nih.gov': 'National Institute of Diabetes',
-            'jdrf.org': 'JDRF (Type 1 Diabetes Research)',
-            'diabetesresearch.org': 'Diabetes Research Institute'
-        }
+        self.trusted_domains = _TRUSTED_DOMAINS
+        self._trusted_sites_filter = " OR ".join(f"site:{domain}" for domain in list(self.trusted_domains)[:5])
         
         print("🌐 GlucoMate Level 4: Smart web search integration loaded")
     
-    def classify_search_need(self, question):
+    def classify_search_need(self, question, matches=None):
         """
         Classify if question needs current web information
         
         Args:
             question (str): User's question
+            matches (dict): Result of scan_keywords(question), if already computed
             
         Returns:
             str: 'current_medical', 'medical', 'casual'
         """
-        question_lower = question.lower()
+        if matches is None:
+            matches = self.scan_keywords(question)
         
         # Check for current information indicators
-        if any(keyword in question_lower for keyword in self.current_info_keywords):
+        if 'current_info' in matches:
             return 'current_medical'
         
         # Use inherited classification for other types
-        return self.classify_conversation_type(question)
+        return self.classify_conversation_type(question, matches)
     
     def create_search_query(self, user_question):
         """
@@ -102,35 +168,93 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
             search_query = user_question
         
         # Add site restrictions for trusted sources
-        trusted_sites = " OR ".join([f"site:{domain}" for domain in list(self.trusted_domains.keys())[:5]])
-        search_query = f"{search_query} ({trusted_sites})"
+        search_query = f"{search_query} ({self._trusted_sites_filter})"
         
         print(f"🔍 Search query: {search_query}")
         return search_query
     
-    def search_trusted_medical_sources(self, query):
+    def get_search_service(self):
+        """
+        Build the Google Custom Search service on first use
+        
+        Returns:
+            Resource: Custom Search service or None if unavailable
+        """
+        if self.search_service is None and not self._search_attempted:
+            self._search_attempted = True
+            if not self.search_configured:
+                return None
+            
+            try:
+                from googleapiclient.discovery import build
+                # Use the discovery document bundled with googleapiclient instead of fetching it
+                self.search_service = build(
+                    "customsearch", "v1",
+                    developerKey=self.google_api_key,
+                    http=self.get_search_http(),
+                    static_discovery=True,
+                    cache_discovery=False
+                )
+                print("🔍 Connected to trusted medical search sources")
+            except Exception as e:
+                self.search_service = None
+                print(f"💭 Search temporarily unavailable: {str(e)[:50]}...")
+        
+        return self.search_service
+    
+    def get_search_http(self):
+        """
+        HTTP connection for Custom Search requests on the current thread
+        
+        Each worker thread keeps its own httplib2 connection open, so repeat
+        searches reuse the TLS session to googleapis.com instead of paying
+        a new handshake every time.
+        
+        Returns:
+            httplib2.Http: Keep-alive HTTP connection
+        """
+        http = getattr(self._search_http, 'http', None)
+        if http is None:
+            import httplib2
+            http = httplib2.Http(cache=None, timeout=_SEARCH_HTTP_TIMEOUT)
+            self._search_http.http = http
+        return http
+    
+    def search_trusted_medical_sources(self, query, quota_message=True):
         """
         Search trusted medical sources with error handling
         
         Args:
             query (str): Search query
+            quota_message (bool): When the daily search quota is used up, return a
+                friendly notice instead of None
             
         Returns:
             str: Processed search results or None if failed
         """
-        if not self.search_service:
+        search_service = self.get_search_service()
+        if not search_service:
             return None
+        
+        cache_key = query_cache_key(query)
+        cached_answer = self._search_cache.get(cache_key)
+        if cached_answer:
+            print("⚡ Search answer from cache")
+            return cached_answer
             
         try:
             search_query = self.create_search_query(query)
-            result = self.search_service.cse().list(
+            result = search_service.cse().list(
                 q=search_query, 
                 cx=self.search_engine_id, 
                 num=5
-            ).execute()
+            ).execute(http=self.get_search_http())
             
             if 'items' in result:
-                return self.process_search_results(result['items'], query)
+                answer = self.process_search_results(result['items'], query)
+                if answer:
+                    self._search_cache.set(cache_key, answer)
+                return answer
             else:
                 print("🔍 No search results found")
                 return None
@@ -138,6 +262,8 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
         except Exception as e:
             error_str = str(e)
             if "quota" in error_str.lower():
+                if not quota_message:
+                    return None
                 return "I've reached my daily search limit, but let me check my medical knowledge base for you."
             elif "invalid" in error_str.lower():
                 print("🔍 Search query invalid, trying knowledge base instead")
@@ -146,6 +272,44 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
                 print(f"🔍 Search error: {error_str[:50]}...")
                 return None
     
+    def race_medical_sources(self, query, timeout=None):
+        """
+        Query web search and the knowledge base at the same time
+        
+        Both calls spend nearly all their time waiting on the network, so
+        running them on threads overlaps the round-trips and the turn takes
+        min(search, knowledge base) instead of their sum. The first useful
+        answer wins. A loser that is already running can't be cancelled; it
+        finishes in the background and still fills its response cache.
+        
+        Args:
+            query (str): User's question in English
+            timeout (float): Seconds to wait for either source (default: source_race_timeout)
+            
+        Returns:
+            tuple: (web_response, kb_response), at most one of them set
+        """
+        if timeout is None:
+            timeout = self.source_race_timeout
+        
+        # A quota notice or throttled knowledge base must not beat a real answer
+        web_future = self._io_pool.submit(self.search_trusted_medical_sources, query, quota_message=False)
+        kb_future = self._io_pool.submit(self.query_medical_knowledge, query, busy_message=False)
+        
+        try:
+            for future in as_completed([web_future, kb_future], timeout=timeout):
+                result = future.result()
+                if result:
+                    if future is web_future:
+                        kb_future.cancel()
+                        return result, None
+                    web_future.cancel()
+                    return None, result
+        except FuturesTimeoutError:
+            print("⏱️ Medical sources are taking too long to respond")
+        
+        return None, None
+    
     def process_search_results(self, results, original_query):
         """
         Process and synthesize search results
@@ -157,78 +321,56 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
         Returns:
             str: Synthesized response from search results
         """
+        # Extract domain and verify trustworthiness; results without a usable link are skipped
+        hosts = [(result, _link_host(result.get('link'))) for result in results]
+        compiled_info = [
+            (self.get_source_name(domain), _trusted_domain(domain) is not None, result)
+            for result, domain in hosts if domain is not None
+        ]
+        if not compiled_info:
+            return None
+        
+        trusted_sources = [source_name for source_name, trusted, _ in compiled_info if trusted]
+        
+        # One compact line per source; the model doesn't need the URL
+        sources = "\n".join(
+            f"- **{source_name}**{' (trusted)' if trusted else ''} — {result.get('title', 'No title')}: "
+            f"{result.get('snippet', 'No snippet')[:_SNIPPET_MAX_CHARS]}"
+            for source_name, trusted, result in compiled_info
+        )
+        
+        # Create synthesis prompt with search results
+        synthesis_prompt = f"""<<QUERY>>
+{original_query}
+<<SOURCES>>
+{sources}"""
+        
         try:
-            compiled_info = []
-            trusted_sources = []
-            
-            for result in results:
-                # Extract domain and verify trustworthiness
-                try:
-                    domain = result['link'].split('/')[2]
-                    source_name = self.get_source_name(domain)
-                    
-                    compiled_info.append({
-                        "title": result.get('title', 'No title'),
-                        "snippet": result.get('snippet', 'No snippet'),
-                        "source": source_name,
-                        "url": result['link'],
-                        "trusted": domain in self.trusted_domains
-                    })
-                    
-                    if domain in self.trusted_domains:
-                        trusted_sources.append(source_name)
-                        
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    continue
-            
-            if not compiled_info:
-                return None
-            
-            # Create synthesis prompt with search results
-            synthesis_prompt = f"""
-            You are GlucoMate, a warm and caring diabetes companion. A person asked: "{original_query}"
-            
-            Based on these current medical sources:
-            {json.dumps(compiled_info, indent=2)}
-            
-            Please synthesize this information into a warm, conversational response that:
-            1. Acknowledges their question with empathy
-            2. Provides clear, helpful information from the sources
-            3. Prioritizes information from trusted medical sources
-            4. Uses encouraging, supportive language
-            5. Includes practical tips they can use
-            6. Shows you care about their wellbeing
-            7. Sounds like a knowledgeable friend, not a medical textbook
-            8. Keeps all medical accuracy while being warm and personal
-            9. Mentions that this is current/recent information when relevant
-            
-            Start with a caring acknowledgment, then provide the helpful information conversationally.
-            """
-            
-            # Use inherited Bedrock calling method
+            # Use inherited Bedrock method; errors give None so they never win the race or get cached
             response = self.call_bedrock_model(
                 synthesis_prompt, 
                 conversation_type="medical",
-                temperature=0.3  # Balance accuracy with warmth
+                temperature=0.3,  # Balance accuracy with warmth
+                max_tokens=self.estimate_max_tokens(original_query),
+                raise_errors=True,
+                system=_SEARCH_SYNTHESIS_PROMPT  # Static instructions, separate from the per-turn sources
             )
-            
-            # Add source attribution
-            if trusted_sources:
-                source_attribution = f"\n\n🌐 **Current Sources**: I found this recent information from trusted sources including {', '.join(trusted_sources[:2])}."
-            else:
-                source_attribution = f"\n\n🌐 **Sources**: Information from current medical research and healthcare websites."
-            
-            print("✨ Synthesized response from current medical sources!")
-            return response + source_attribution
-            
         except Exception as e:
             print(f"❌ Error processing search results: {e}")
             return None
+        
+        # Add source attribution
+        if trusted_sources:
+            response += f"\n\n🌐 **Current Sources**: I found this recent information from trusted sources including {', '.join(trusted_sources[:2])}."
+        else:
+            response += f"\n\n🌐 **Sources**: Information from current medical research and healthcare websites."
+        
+        print("✨ Synthesized response from current medical sources!")
+        return response
     
     def get_source_name(self, domain):
         """Convert domain to friendly source names"""
-        return self.trusted_domains.get(domain, f"medical website ({domain})")
+        return _source_name(domain)
     
     def smart_search_chat(self, user_input, target_language_code, auto_detect=False):
         """
@@ -243,9 +385,14 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
             str: Response with smart search enhancement
         """
         
+        # Catch obvious emergencies before paying for translation
+        emergency_language = self.detect_emergency_before_translation(user_input, target_language_code)
+        if emergency_language:
+            return self.get_emergency_message(emergency_language if auto_detect else target_language_code)
+        
         # Handle language detection (inherited)
         if auto_detect:
-            detected_language = self.detect_language(user_input)
+            detected_language = self.detect_language(user_input, default=target_language_code)
             if detected_language != target_language_code:
                 print(f"🔍 Detected language: {detected_language}")
                 target_language_code = detected_language
@@ -254,23 +401,17 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
         english_input = self.translate_to_english(user_input, target_language_code)
         
         # Safety check first (inherited)
-        safety_check = self.check_safety(english_input)
+        keyword_matches = self.scan_keywords(english_input)
+        safety_check = self.check_safety(english_input, keyword_matches)
         
         if safety_check['is_emergency']:
-            emergency_msg = safety_check['message']
-            if target_language_code != 'en':
-                emergency_msg = self.translate_response(emergency_msg, target_language_code)
-            return emergency_msg
+            return self.get_emergency_message(target_language_code)
         
         # Get language name
-        language_name = "English"
-        for code, (name, lang_code) in self.supported_languages.items():
-            if lang_code == target_language_code:
-                language_name = name
-                break
+        language_name = self._lang_code_to_name.get(target_language_code, "English")
         
         # Classify search need
-        search_classification = self.classify_search_need(english_input)
+        search_classification = self.classify_search_need(english_input, keyword_matches)
         response = None
         
         print("💭 Analyzing your question...")
@@ -279,29 +420,43 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
         if search_classification == "casual":
             return self.multilingual_chat(user_input, target_language_code, auto_detect)
         
-        # For current medical info, try web search first
-        if search_classification == "current_medical" and self.search_service:
+        # Reuse the answer to a recent rewording of this question. Questions that
+        # raised a safety warning are always answered fresh
+        cacheable = safety_check['urgency_level'] == 'NORMAL'
+        if cacheable:
+            cached_answer = self._answer_cache.get(english_input, target_language_code)
+            if cached_answer:
+                print("⚡ Answered from a recent similar question")
+                return cached_answer
+        
+        # For current medical info, search the web and knowledge base together
+        kb_response = None
+        kb_checked = False
+        if search_classification == "current_medical" and self.search_configured:
             print("🌐 Searching for the latest medical information...")
-            web_response = self.search_trusted_medical_sources(english_input)
+            web_response, kb_response = self.race_medical_sources(english_input)
+            kb_checked = True
             if web_response:
                 print("✅ Found current information from trusted sources!")
                 response = web_response
         
         # Try knowledge base if no web response (inherited)
         if not response:
-            print("📚 Checking medical knowledge base...")
-            kb_response = self.query_medical_knowledge(english_input)
-            if kb_response:
-                print("✅ Found authoritative information!")
-                
-                # Enhance KB response with conversational tone (inherited method)
-                enhancement_prompt = self.create_knowledge_enhanced_prompt(
-                    english_input, kb_response, language_name
-                )
-                response = self.call_bedrock_model(
-                    enhancement_prompt, 
-                    conversation_type="medical"
+            stream_output = False
+            if not kb_checked:
+                print("📚 Checking medical knowledge base...")
+                # No "try again" notice here: it would be cached as the answer.
+                # English answers without a warning are streamed while generated
+                stream_output = target_language_code == 'en' and safety_check['urgency_level'] == 'NORMAL'
+                kb_response = self.query_medical_knowledge(
+                    english_input, busy_message=False,
+                    on_text=self.stream_callback if stream_output else None
                 )
+            if kb_response:
+                if not stream_output:  # Status lines would land inside the streamed answer
+                    print("✅ Found authoritative information!")
+                # Knowledge base answers already come back in a conversational tone
+                response = kb_response
         
         # Final fallback to multilingual chat (inherited)
         if not response:
@@ -309,31 +464,35 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
             return self.knowledge_enhanced_chat(user_input, target_language_code, auto_detect)
         
         # Add encouragement if needed (inherited)
-        if any(word in english_input.lower() for word in ['scared', 'worried', 'difficult', 'hard', 'confused']):
-            encouragement = "\n\n" + self.encouragement[hash(english_input) % len(self.encouragement)]
+        if 'distress' in keyword_matches:
+            # Deterministic pick so the same question always gets the same phrase
+            pick = zlib.crc32(english_input.encode('utf-8')) % len(self.encouragement)
+            encouragement = "\n\n" + self.encouragement[pick]
             response = response + encouragement
         
-        # Translate response (inherited method)
-        if target_language_code != 'en':
-            response = self.enhance_medical_translation(response, target_language_code)
+        # Translate response and any safety warning together (inherited method)
+        warning_msg = None
+        if safety_check['urgency_level'] in ['HIGH', 'MODERATE']:
+            warning_msg = safety_check['message']
+        response, warning_msg = self.translate_turn(response, warning_msg, target_language_code)
         
         # Add medical disclaimer (inherited method)
         response = self.add_medical_disclaimer(response, language_name)
         
         # Add safety warnings if needed (inherited)
-        if safety_check['urgency_level'] in ['HIGH', 'MODERATE']:
-            warning_msg = safety_check['message']
-            if target_language_code != 'en':
-                warning_msg = self.translate_response(warning_msg, target_language_code)
+        if warning_msg:
             response = warning_msg + "\n\n" + response
         
+        if cacheable:
+            self._answer_cache.set(english_input, target_language_code, response)
+        
         return response
     
     def test_search_capability(self):
         """Test web search functionality"""
         print("🧪 Testing web search capability...")
         
-        if not self.search_service:
+        if not self.get_search_service():
             print("❌ Web search not available")
             return False
         
@@ -355,7 +514,7 @@ class SmartMedicalSearchGlucoMate(KnowledgeEnhancedGlucoMate):
     def get_search_stats(self):
         """Get search capability information"""
         return {
-            'search_available': self.search_service is not None,
+            'search_available': self.search_configured,
             'trusted_domains': len(self.trusted_domains),
             'current_keywords': len(self.current_info_keywords),
             'google_api_configured': bool(self.google_api_key),
@@ -374,6 +533,7 @@ def main():
     print("   • All previous features (multilingual, knowledge base)")
     
     bot = SmartMedicalSearchGlucoMate()
+    bot.stream_to_terminal("🌐 GlucoMate: ")
     
     # Test capabilities
     search_stats = bot.get_search_stats()
@@ -403,7 +563,7 @@ def main():
     # Auto-detect option (inherited)
     auto_detect_prompt = "Enable automatic language detection? (y/n): "
     if language_code != 'en':
-        auto_detect_prompt = bot.translate_response(auto_detect_prompt, language_code)
+        auto_detect_prompt = bot.translate_static(auto_detect_prompt, language_code)
     auto_detect = input(f"🔍 {auto_detect_prompt}").lower().startswith('y')
     
     # Smart search suggestions
@@ -425,7 +585,7 @@ def main():
     
     exit_instruction = "Type 'quit' to exit"
     if language_code != 'en':
-        exit_instruction = bot.translate_response(exit_instruction, language_code)
+        exit_instruction = bot.translate_static(exit_instruction, language_code)
     print(f"\n{exit_instruction}")
     
     try:
@@ -439,12 +599,12 @@ def main():
             
             if user_input:
                 response = bot.smart_search_chat(user_input, language_code, auto_detect)
-                print(f"\n🌐 GlucoMate: {response}")
+                bot.print_response(response, "🌐 GlucoMate: ")
                 print("\n" + "─" * 60)
             else:
                 ready_msg = "I'm here with the latest medical information and research!"
                 if language_code != 'en':
-                    ready_msg = bot.translate_response(ready_msg, language_code)
+                    ready_msg = bot.translate_static(ready_msg, language_code)
                 print(f"💭 {ready_msg}")
                 
     except KeyboardInterrupt:
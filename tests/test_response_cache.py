@@ -0,0 +1,50 @@
+import unittest
+
+from response_cache import SemanticCache
+
+
+class SemanticCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = SemanticCache()
+
+    def assertNotReused(self, cached_question, question):
+        self.cache.set(cached_question, 'en', "cached answer")
+        self.assertIsNone(self.cache.get(question, 'en'))
+
+    def test_rewording_is_reused(self):
+        self.cache.set("good foods for diabetes", 'en', "answer")
+        self.assertEqual(self.cache.get("What foods are good for diabetes?", 'en'), "answer")
+
+    def test_other_language_is_not_reused(self):
+        self.assertIsNone(self.cache.get("good foods for diabetes", 'fr'))
+        self.cache.set("good foods for diabetes", 'en', "answer")
+        self.assertIsNone(self.cache.get("good foods for diabetes", 'fr'))
+
+    def test_diabetes_type_must_match(self):
+        self.assertNotReused("what are the latest insulin treatments for type 1 diabetes in children",
+                             "what are the latest insulin treatments for type 2 diabetes in children")
+
+    def test_numbers_must_match(self):
+        self.assertNotReused("my fasting blood sugar is 130 in the morning, is that normal",
+                             "my fasting blood sugar is 180 in the morning, is that normal")
+
+    def test_organ_must_match(self):
+        self.assertNotReused("is it safe to take metformin during pregnancy with kidney disease",
+                             "is it safe to take metformin during pregnancy with liver disease")
+
+    def test_negation_must_match(self):
+        self.assertNotReused("what foods should people with diabetes and high cholesterol not eat for breakfast",
+                             "what foods should people with diabetes and high cholesterol eat for breakfast")
+
+    def test_antonyms_must_match(self):
+        self.assertNotReused("which fruits are bad for people with diabetes to eat every day",
+                             "which fruits are good for people with diabetes to eat every day")
+        self.assertNotReused("what should people with type 2 diabetes who want to gain weight eat",
+                             "what should people with type 2 diabetes who want to lose weight eat")
+        self.assertNotReused("does eating white rice every day decrease the risk of type 2 diabetes",
+                             "does eating white rice every day increase the risk of type 2 diabetes")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Pre-translated interface strings for GlucoMate
+Fixed messages ship in every supported language, so they never wait on
+AWS Translate and never silently fall back to English
+"""
+
+UI_STRINGS = {
+    'en': {
+        'emergency': '🚨 **MEDICAL EMERGENCY**: What you\'re describing sounds like a serious medical emergency. Please call 911 (or your local emergency number) immediately or go to the nearest emergency room right now. Do not delay - your safety is the top priority.',
+        'high_warning': '⚠️ **Important**: What you\'re describing needs prompt medical attention. Please contact your healthcare provider or diabetes care team as soon as possible today. If it\'s after hours, consider calling their emergency line or visiting an urgent care center.',
+        'moderate_warning': '💛 **Keep an eye on this**: What you\'re describing is worth monitoring. Consider discussing this with your healthcare provider at your next appointment, or sooner if it gets worse or doesn\'t improve.',
+        'auto_detect_prompt': "Enable automatic language detection? (y/n): ",
+        'exit_instruction': "Type 'quit' to exit"
+    },
+    'ar': {
+        'emergency': '🚨 **حالة طبية طارئة**: ما تصفه يبدو كحالة طبية طارئة خطيرة. يرجى الاتصال بالرقم 911 (أو رقم الطوارئ المحلي) فوراً أو التوجه إلى أقرب قسم طوارئ الآن. لا تتأخر - سلامتك هي الأولوية القصوى.',
+        'high_warning': '⚠️ **مهم**: ما تصفه يحتاج إلى عناية طبية عاجلة. يرجى التواصل مع طبيبك أو فريق رعاية السكري الخاص بك في أقرب وقت ممكن اليوم. إذا كان ذلك خارج ساعات العمل، ففكر في الاتصال بخط الطوارئ الخاص بهم أو زيارة مركز رعاية عاجلة.',
+        'moderate_warning': '💛 **انتبه لهذا**: ما تصفه يستحق المتابعة. فكر في مناقشته مع طبيبك في موعدك القادم، أو قبل ذلك إذا ساءت الحالة أو لم تتحسن.',
+        'auto_detect_prompt': "تفعيل الكشف التلقائي عن اللغة؟ (y/n): ",
+        'exit_instruction': "اكتب 'quit' أو 'خروج' للخروج"
+    },
+    'fr': {
+        'emergency': "🚨 **URGENCE MÉDICALE**: Ce que vous décrivez ressemble à une urgence médicale grave. Appelez immédiatement le 911 (ou votre numéro d'urgence local) ou rendez-vous tout de suite aux urgences les plus proches. N'attendez pas - votre sécurité est la priorité absolue.",
+        'high_warning': "⚠️ **Important**: Ce que vous décrivez nécessite une attention médicale rapide. Veuillez contacter votre professionnel de santé ou votre équipe de soins du diabète dès que possible aujourd'hui. En dehors des heures d'ouverture, pensez à appeler leur ligne d'urgence ou à vous rendre dans un centre de soins urgents.",
+        'moderate_warning': "💛 **À surveiller**: Ce que vous décrivez mérite d'être surveillé. Pensez à en parler à votre professionnel de santé lors de votre prochain rendez-vous, ou plus tôt si cela s'aggrave ou ne s'améliore pas.",
+        'auto_detect_prompt': "Activer la détection automatique de la langue? (y/n): ",
+        'exit_instruction': "Tapez 'quit' ou 'quitter' pour sortir"
+    },
+    'es': {
+        'emergency': '🚨 **EMERGENCIA MÉDICA**: Lo que describe parece una emergencia médica grave. Llame al 911 (o a su número local de emergencias) de inmediato o acuda ahora mismo a la sala de emergencias más cercana. No espere - su seguridad es la máxima prioridad.',
+        'high_warning': '⚠️ **Importante**: Lo que describe necesita atención médica pronto. Comuníquese con su proveedor de salud o su equipo de atención de la diabetes lo antes posible hoy. Si es fuera del horario de atención, considere llamar a su línea de emergencias o acudir a un centro de atención de urgencias.',
+        'moderate_warning': '💛 **Esté atento a esto**: Lo que describe merece seguimiento. Considere hablarlo con su proveedor de salud en su próxima cita, o antes si empeora o no mejora.',
+        'auto_detect_prompt': "¿Activar la detección automática de idioma? (y/n): ",
+        'exit_instruction': "Escriba 'quit' o 'salir' para salir"
+    },
+    'pt': {
+        'emergency': '🚨 **EMERGÊNCIA MÉDICA**: O que você está descrevendo parece ser uma emergência médica grave. Ligue imediatamente para o 911 (ou para o número de emergência local) ou vá agora ao pronto-socorro mais próximo. Não espere - sua segurança é a prioridade máxima.',
+        'high_warning': '⚠️ **Importante**: O que você está descrevendo precisa de atenção médica rápida. Entre em contato com seu médico ou sua equipe de cuidados com o diabetes o mais rápido possível hoje. Se estiver fora do horário de atendimento, considere ligar para a linha de emergência deles ou ir a um pronto atendimento.',
+        'moderate_warning': '💛 **Fique atento a isso**: O que você está descrevendo merece acompanhamento. Considere conversar sobre isso com seu médico na próxima consulta, ou antes se piorar ou não melhorar.',
+        'auto_detect_prompt': "Ativar a detecção automática de idioma? (y/n): ",
+        'exit_instruction': "Digite 'quit' ou 'sair' para sair"
+    },
+    'de': {
+        'emergency': '🚨 **MEDIZINISCHER NOTFALL**: Was Sie beschreiben, klingt nach einem ernsten medizinischen Notfall. Rufen Sie sofort 911 (oder Ihre örtliche Notrufnummer) an oder gehen Sie jetzt in die nächste Notaufnahme. Zögern Sie nicht - Ihre Sicherheit hat oberste Priorität.',
+        'high_warning': '⚠️ **Wichtig**: Was Sie beschreiben, erfordert zeitnahe ärztliche Hilfe. Bitte kontaktieren Sie so bald wie möglich noch heute Ihren Arzt oder Ihr Diabetes-Team. Außerhalb der Sprechzeiten rufen Sie deren Notfallnummer an oder suchen Sie eine Notfallpraxis auf.',
+        'moderate_warning': '💛 **Behalten Sie das im Auge**: Was Sie beschreiben, sollte beobachtet werden. Besprechen Sie es bei Ihrem nächsten Termin mit Ihrem Arzt, oder früher, wenn es schlimmer wird oder sich nicht bessert.',
+        'auto_detect_prompt': "Automatische Spracherkennung aktivieren? (y/n): ",
+        'exit_instruction': "Geben Sie 'quit' oder 'beenden' ein, um zu beenden"
+    }
+}
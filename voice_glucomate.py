@@ -3,11 +3,74 @@ GlucoMate Voice Interface
 A voice-enabled version that can be integrated with speech-to-text and text-to-speech
 """
 
-import boto3
 import json
+import re
 import sys
 from health_tracking_glucomate import HealthTrackingGlucoMate
 
+# Common diabetes voice transcription fixes
+_VOICE_CORRECTIONS = {
+    'sugar level': 'blood sugar level',
+    'glucose level': 'blood glucose level', 
+    'diabetic': 'diabetes',
+    'insulin shot': 'insulin injection',
+    'blood test': 'glucose test',
+    'sugar reading': 'glucose reading',
+    # Add more as needed
+}
+
+# Symbols and emojis with spoken equivalents
+_VOICE_REPLACEMENTS = {
+    '📊': 'Based on your data, ',
+    '🎯': 'Great news: ',
+    '⚠️': 'Important: ',
+    '✅': 'Good: ',
+    '❌': 'Note: ',
+    '💙': '',
+    '🌟': '',
+    '📋': 'Please remember: ',
+    '🔍': '',
+    '💡': 'Here\'s a tip: ',
+    '---': '. ',
+}
+
+# Markdown emphasis and heading characters are simply dropped
+_MARKDOWN_DROP = str.maketrans('', '', '*#')
+
+# Natural pause after each kind of sentence ending
+_PAUSE_SECONDS = {'.': '0.5', '!': '0.3', '?': '0.3'}
+
+def _replacement_pattern(table):
+    """One regex for every key of a replacement table, longest keys first"""
+    return re.compile('|'.join(re.escape(key) for key in sorted(table, key=len, reverse=True)))
+
+_VOICE_CORRECTIONS_RE = _replacement_pattern(_VOICE_CORRECTIONS)
+_VOICE_REPLACEMENTS_RE = _replacement_pattern(_VOICE_REPLACEMENTS)
+_PAUSE_RE = re.compile(r'([.!?]) ')
+
+# Sentence boundaries; the whitespace is captured so it survives the split
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])(\s+)')
+
+# Sentences longer than this are split at a natural joining point
+_LONG_SENTENCE_CHARS = 100
+_SENTENCE_JOINERS = ((', and ', 'And '), (', but ', 'But '))
+
+def _iter_sentences(text):
+    """Yield the sentences of text and the whitespace between them, with long sentences split"""
+    for piece in _SENTENCE_SPLIT_RE.split(text):
+        if len(piece) <= _LONG_SENTENCE_CHARS:
+            yield piece
+            continue
+        
+        # Try to break at natural points
+        for joiner, opener in _SENTENCE_JOINERS:
+            head, found, tail = piece.partition(joiner)
+            if found:
+                yield f"{head}. {opener}{tail}"
+                break
+        else:
+            yield piece
+
 class VoiceGlucoMate(HealthTrackingGlucoMate):
     """
     Voice-enabled GlucoMate with all comprehensive features
@@ -59,84 +122,31 @@ class VoiceGlucoMate(HealthTrackingGlucoMate):
     def clean_voice_input(self, text):
         """Clean common voice transcription errors"""
         
-        # Common diabetes voice transcription fixes
-        corrections = {
-            'sugar level': 'blood sugar level',
-            'glucose level': 'blood glucose level', 
-            'diabetic': 'diabetes',
-            'insulin shot': 'insulin injection',
-            'blood test': 'glucose test',
-            'sugar reading': 'glucose reading',
-            # Add more as needed
-        }
-        
-        cleaned = text
-        for error, correction in corrections.items():
-            cleaned = cleaned.replace(error, correction)
-        
-        return cleaned
+        # All corrections in a single pass over the text
+        return _VOICE_CORRECTIONS_RE.sub(lambda match: _VOICE_CORRECTIONS[match.group(0)], text)
     
     def optimize_for_voice_output(self, text_response):
         """Optimize text response for speech synthesis"""
         
-        # Remove or replace elements that don't speak well
-        voice_optimized = text_response
-        
-        # Replace symbols and emojis with spoken equivalents
-        replacements = {
-            '📊': 'Based on your data, ',
-            '🎯': 'Great news: ',
-            '⚠️': 'Important: ',
-            '✅': 'Good: ',
-            '❌': 'Note: ',
-            '💙': '',
-            '🌟': '',
-            '📋': 'Please remember: ',
-            '🔍': '',
-            '💡': 'Here\'s a tip: ',
-            # Remove markdown formatting
-            '**': '',
-            '*': '',
-            '#': '',
-            '---': '. ',
-            '###': '',
-        }
-        
-        for symbol, replacement in replacements.items():
-            voice_optimized = voice_optimized.replace(symbol, replacement)
+        # Remove markdown formatting, then replace symbols and emojis with
+        # spoken equivalents in one pass
+        voice_optimized = _VOICE_REPLACEMENTS_RE.sub(
+            lambda match: _VOICE_REPLACEMENTS[match.group(0)], text_response.translate(_MARKDOWN_DROP)
+        )
         
         # Break up long sentences for better speech flow
         voice_optimized = self.break_long_sentences(voice_optimized)
         
         # Add natural pauses
-        voice_optimized = voice_optimized.replace('. ', '. <break time="0.5s"/> ')
-        voice_optimized = voice_optimized.replace('! ', '! <break time="0.3s"/> ')
-        voice_optimized = voice_optimized.replace('? ', '? <break time="0.3s"/> ')
+        voice_optimized = _PAUSE_RE.sub(
+            lambda match: f'{match.group(1)} <break time="{_PAUSE_SECONDS[match.group(1)]}s"/> ', voice_optimized
+        )
         
         return voice_optimized
     
     def break_long_sentences(self, text):
         """Break up sentences that are too long for comfortable speech"""
-        sentences = text.split('. ')
-        improved_sentences = []
-        
-        for sentence in sentences:
-            if len(sentence) > 100:  # Long sentence
-                # Try to break at natural points
-                if ', and ' in sentence:
-                    parts = sentence.split(', and ')
-                    improved_sentences.append(parts[0] + '.')
-                    improved_sentences.append('And ' + ', and '.join(parts[1:]))
-                elif ', but ' in sentence:
-                    parts = sentence.split(', but ')
-                    improved_sentences.append(parts[0] + '.')
-                    improved_sentences.append('But ' + ', but '.join(parts[1:]))
-                else:
-                    improved_sentences.append(sentence)
-            else:
-                improved_sentences.append(sentence)
-        
-        return '. '.join(improved_sentences)
+        return ''.join(_iter_sentences(text))
     
     def get_voice_commands(self):
         """Get list of supported voice commands"""